@@ -21,7 +21,10 @@ from PyQt6.QtWidgets import (
     QGridLayout, QSizePolicy, QCheckBox, QCompleter
 )
 from PyQt6.QtCore import Qt, QTimer, QSize, QStringListModel
-from PyQt6.QtGui import QPixmap, QImage, QFont, QPalette, QColor, QPainter
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QFont, QPalette, QColor, QPainter
+
+# Size of the QPixmapCache holding cut-out question/answer images, in KB
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024
 
 class HelpNoteDialog(QDialog):
     """Dialog for adding help notes to questions"""
@@ -220,9 +223,12 @@ class CombineSessionsDialog(QDialog):
 class PerfectImageViewer(QWidget):
     """Advanced PDF viewer for displaying perfectly cut out question/answer images"""
     
+    MAX_OPEN_DOCUMENTS = 4  # Question and answer PDFs of the current pair, plus the previous pair
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.pdf_document = None
+        self.open_documents = {}  # pdf_path -> fitz.Document, least recently used first
         self.current_page = None
         self.stem_pixmap = None
         self.question_pixmap = None
@@ -264,13 +270,20 @@ class PerfectImageViewer(QWidget):
         self.setLayout(layout)
     
     def load_pdf(self, pdf_path):
-        """Load a PDF file"""
+        """Load a PDF file, reusing it if it was opened recently"""
         try:
-            if self.pdf_document:
-                self.pdf_document.close()
-            self.pdf_document = fitz.open(pdf_path)
+            document = self.open_documents.pop(pdf_path, None)
+            if document is None:
+                document = fitz.open(pdf_path)
+                if len(self.open_documents) >= self.MAX_OPEN_DOCUMENTS:
+                    oldest = next(iter(self.open_documents))
+                    self.open_documents.pop(oldest).close()
+                    fitz.TOOLS.store_shrink(100)  # Drop fonts/images decoded for the closed file
+            self.open_documents[pdf_path] = document  # Re-inserting marks it most recently used
+            self.pdf_document = document
             return True
         except Exception as e:
+            self.pdf_document = None  # Don't cut regions from whichever PDF was shown before
             print(f"Error loading PDF: {e}")
             self.status_label.setText(f"Error loading PDF: {e}")
             return False
@@ -289,12 +302,12 @@ class PerfectImageViewer(QWidget):
             
             # Extract the region with high resolution
             mat = fitz.Matrix(3.0, 3.0)  # High resolution for crisp images
-            pix = page.get_pixmap(matrix=mat, clip=rect, alpha=False)
+            pix = page.get_pixmap(matrix=mat, clip=rect, colorspace=fitz.csRGB, alpha=False)
             
-            # Convert to QPixmap
-            img_data = pix.tobytes("ppm")
-            qimg = QImage.fromData(img_data)
-            pixmap = QPixmap.fromImage(qimg)
+            # Convert to QPixmap straight from the raw RGB samples (no PPM encode/parse);
+            # copy() so the image owns its bytes once pix is freed
+            qimg = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+            pixmap = QPixmap.fromImage(qimg.copy())
             
             return pixmap
             
@@ -405,6 +418,8 @@ class HomeworkPractice(QMainWindow):
     def __init__(self):
         super().__init__()
         self.pdf_pairs_data = {}
+        self.selection_index = {}  # selection_id -> [(pdf_path, 'pdf1'/'pdf2', page_num, region)], built in load_data
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)  # Cut-out images, so going back doesn't re-render
         self.links_data = {}
         self.help_data = {}
         self.current_questions = []
@@ -904,6 +919,7 @@ class HomeworkPractice(QMainWindow):
                 with open(self.pdf_pairs_file, 'r') as f:
                     self.pdf_pairs_data = json.load(f)
                 print(f"Loaded {len(self.pdf_pairs_data.get('pairs', {}))} PDF pairs")
+                self.build_selection_index()
             else:
                 QMessageBox.warning(self, "File Not Found", f"Could not find {self.pdf_pairs_file}")
                 return
@@ -1080,43 +1096,46 @@ class HomeworkPractice(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error setting up practice session: {e}")
     
+    def build_selection_index(self):
+        """Index every annotation by selection_id so lookups don't rescan all pairs"""
+        self.selection_index = {}
+        for pair_id, pair_data in self.pdf_pairs_data.get('pairs', {}).items():
+            # Same order the lookups used to scan in: pair by pair, question PDF before answer PDF
+            for pdf_key in ('pdf1', 'pdf2'):
+                pdf_path = pair_data.get(f'{pdf_key}_path')
+                for page_num, page_annotations in pair_data.get(f'{pdf_key}_annotations', {}).items():
+                    for ann in page_annotations:
+                        selection_id = ann.get('selection_id')
+                        if selection_id:
+                            region = self.absolute_region(ann.get('coordinates', {}))
+                            self.selection_index.setdefault(selection_id, []).append(
+                                (pdf_path, pdf_key, int(page_num), region))
+    
+    @staticmethod
+    def absolute_region(coords):
+        """Return (x1, y1, x2, y2) in PDF points for new or legacy coordinates, or None if malformed"""
+        try:
+            if 'x1' in coords:
+                # New format with absolute coordinates
+                return coords['x1'], coords['y1'], coords['x2'], coords['y2']
+            # Legacy format - convert to absolute coordinates
+            page_width = 612  # Standard PDF page width
+            page_height = 792  # Standard PDF page height
+            x1 = coords['x'] * page_width
+            y1 = coords['y'] * page_height
+            x2 = x1 + (coords['width'] * page_width)
+            y2 = y1 + (coords['height'] * page_height)
+            return x1, y1, x2, y2
+        except (KeyError, TypeError):
+            return None
+    
     def question_exists_in_pdfs(self, question_id):
         """Check if a question exists in the PDF pairs data"""
-        for pair_id, pair_data in self.pdf_pairs_data.get('pairs', {}).items():
-            pdf1_annotations = pair_data.get('pdf1_annotations', {})
-            pdf2_annotations = pair_data.get('pdf2_annotations', {})
-            
-            # Search in both PDFs
-            for page_annotations in pdf1_annotations.values():
-                for ann in page_annotations:
-                    if ann.get('selection_id') == question_id:
-                        return True
-            
-            for page_annotations in pdf2_annotations.values():
-                for ann in page_annotations:
-                    if ann.get('selection_id') == question_id:
-                        return True
-        
-        return False
+        return question_id in self.selection_index
     
     def answer_exists_in_pdfs(self, answer_id):
         """Check if an answer exists in the PDF pairs data"""
-        for pair_id, pair_data in self.pdf_pairs_data.get('pairs', {}).items():
-            pdf1_annotations = pair_data.get('pdf1_annotations', {})
-            pdf2_annotations = pair_data.get('pdf2_annotations', {})
-            
-            # Search in both PDFs
-            for page_annotations in pdf1_annotations.values():
-                for ann in page_annotations:
-                    if ann.get('selection_id') == answer_id:
-                        return True
-            
-            for page_annotations in pdf2_annotations.values():
-                for ann in page_annotations:
-                    if ann.get('selection_id') == answer_id:
-                        return True
-        
-        return False
+        return answer_id in self.selection_index
     
     def load_current_question(self):
         """Load and display the current question with stem if available"""
@@ -1235,77 +1254,32 @@ class HomeworkPractice(QMainWindow):
                 }
             """)
        
+    def extract_selection_image(self, selection_id, kind="Question"):
+        """Cut out the region annotated with selection_id and return it as QPixmap"""
+        cache_key = f"selection:{selection_id}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return pixmap
+        
+        for pdf_path, pdf_key, page_num, region in self.selection_index.get(selection_id, ()):
+            if pdf_path and os.path.exists(pdf_path):
+                if not self.image_viewer.load_pdf(pdf_path):
+                    continue
+                if region is None:
+                    raise ValueError(f"invalid coordinates for {selection_id}")
+                pixmap = self.image_viewer.extract_perfect_region(page_num, *region)
+                if pixmap is not None:
+                    QPixmapCache.insert(cache_key, pixmap)
+                return pixmap
+        
+        # If we get here, the selection wasn't found
+        print(f"{kind} not found: {selection_id}")
+        return None
+    
     def extract_question_image(self, question_id):
         """Extract the perfectly cut out image for a question or stem and return as QPixmap"""
         try:
-            # Find the question in PDF pairs data
-            for pair_id, pair_data in self.pdf_pairs_data.get('pairs', {}).items():
-                pdf1_annotations = pair_data.get('pdf1_annotations', {})
-                pdf2_annotations = pair_data.get('pdf2_annotations', {})
-                
-                # Search in both PDFs
-                for page_num, page_annotations in pdf1_annotations.items():
-                    for ann in page_annotations:
-                        if ann.get('selection_id') == question_id:
-                            # Load PDF and extract region
-                            pdf_path = pair_data.get('pdf1_path')
-                            if pdf_path and os.path.exists(pdf_path):
-                                self.image_viewer.load_pdf(pdf_path)
-                                coords = ann.get('coordinates', {})
-                                
-                                if 'x1' in coords:
-                                    # New format with absolute coordinates
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), 
-                                        coords['x1'], coords['y1'], 
-                                        coords['x2'], coords['y2']
-                                    )
-                                else:
-                                    # Legacy format - convert to absolute coordinates
-                                    page_width = 612  # Standard PDF page width
-                                    page_height = 792  # Standard PDF page height
-                                    x1 = coords['x'] * page_width
-                                    y1 = coords['y'] * page_height
-                                    x2 = x1 + (coords['width'] * page_width)
-                                    y2 = y1 + (coords['height'] * page_height)
-                                    
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), x1, y1, x2, y2
-                                    )
-                
-                # Search in PDF2 (answers)
-                for page_num, page_annotations in pdf2_annotations.items():
-                    for ann in page_annotations:
-                        if ann.get('selection_id') == question_id:
-                            # Load PDF and extract region
-                            pdf_path = pair_data.get('pdf2_path')
-                            if pdf_path and os.path.exists(pdf_path):
-                                self.image_viewer.load_pdf(pdf_path)
-                                coords = ann.get('coordinates', {})
-                                
-                                if 'x1' in coords:
-                                    # New format with absolute coordinates
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), 
-                                        coords['x1'], coords['y1'], 
-                                        coords['x2'], coords['y2']
-                                    )
-                                else:
-                                    # Legacy format - convert to absolute coordinates
-                                    page_width = 612  # Standard PDF page width
-                                    page_height = 792  # Standard PDF page height
-                                    x1 = coords['x'] * page_width
-                                    y1 = coords['y'] * page_height
-                                    x2 = x1 + (coords['width'] * page_width)
-                                    y2 = y1 + (coords['height'] * page_height)
-                                    
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), x1, y1, x2, y2
-                                    )
-            
-            # If we get here, question wasn't found
-            print(f"Question not found: {question_id}")
-            return None
+            return self.extract_selection_image(question_id)
             
         except Exception as e:
             print(f"Error extracting question image: {e}")
@@ -1321,74 +1295,7 @@ class HomeworkPractice(QMainWindow):
                 print(f"No answer linked to question: {question_id}")
                 return None
             
-            # Find the answer in PDF pairs data
-            for pair_id, pair_data in self.pdf_pairs_data.get('pairs', {}).items():
-                pdf1_annotations = pair_data.get('pdf1_annotations', {})
-                pdf2_annotations = pair_data.get('pdf2_annotations', {})
-                
-                # Search in both PDFs
-                for page_num, page_annotations in pdf1_annotations.items():
-                    for ann in page_annotations:
-                        if ann.get('selection_id') == answer_id:
-                            # Load PDF and extract region
-                            pdf_path = pair_data.get('pdf1_path')
-                            if pdf_path and os.path.exists(pdf_path):
-                                self.image_viewer.load_pdf(pdf_path)
-                                coords = ann.get('coordinates', {})
-                                
-                                if 'x1' in coords:
-                                    # New format with absolute coordinates
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), 
-                                        coords['x1'], coords['y1'], 
-                                        coords['x2'], coords['y2']
-                                    )
-                                else:
-                                    # Legacy format - convert to absolute coordinates
-                                    page_width = 612  # Standard PDF page width
-                                    page_height = 792  # Standard PDF page height
-                                    x1 = coords['x'] * page_width
-                                    y1 = coords['y'] * page_height
-                                    x2 = x1 + (coords['width'] * page_width)
-                                    y2 = y1 + (coords['height'] * page_height)
-                                    
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), x1, y1, x2, y2
-                                    )
-                
-                # Search in PDF2 (answers)
-                for page_num, page_annotations in pdf2_annotations.items():
-                    for ann in page_annotations:
-                        if ann.get('selection_id') == answer_id:
-                            # Load PDF and extract region
-                            pdf_path = pair_data.get('pdf2_path')
-                            if pdf_path and os.path.exists(pdf_path):
-                                self.image_viewer.load_pdf(pdf_path)
-                                coords = ann.get('coordinates', {})
-                                
-                                if 'x1' in coords:
-                                    # New format with absolute coordinates
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), 
-                                        coords['x1'], coords['y1'], 
-                                        coords['x2'], coords['y2']
-                                    )
-                                else:
-                                    # Legacy format - convert to absolute coordinates
-                                    page_width = 612  # Standard PDF page width
-                                    page_height = 792  # Standard PDF page height
-                                    x1 = coords['x'] * page_width
-                                    y1 = coords['y'] * page_height
-                                    x2 = x1 + (coords['width'] * page_width)
-                                    y2 = y1 + (coords['height'] * page_height)
-                                    
-                                    return self.image_viewer.extract_perfect_region(
-                                        int(page_num), x1, y1, x2, y2
-                                    )
-            
-            # If we get here, answer wasn't found
-            print(f"Answer not found: {answer_id}")
-            return None
+            return self.extract_selection_image(answer_id, kind="Answer")
             
         except Exception as e:
             print(f"Error extracting answer image: {e}")
@@ -1816,14 +1723,9 @@ class HomeworkPractice(QMainWindow):
     
     def get_question_page_number(self, question_id):
         """Get the page number where a question appears in the question PDF"""
-        for pair_id, pair_data in self.pdf_pairs_data.get('pairs', {}).items():
-            pdf1_annotations = pair_data.get('pdf1_annotations', {})
-            
-            # Search in question PDF (pdf1)
-            for page_num, page_annotations in pdf1_annotations.items():
-                for ann in page_annotations:
-                    if ann.get('selection_id') == question_id:
-                        return int(page_num) + 1
+        for pdf_path, pdf_key, page_num, region in self.selection_index.get(question_id, ()):
+            if pdf_key == 'pdf1':
+                return page_num + 1
         
         return None
     
@@ -8,19 +8,115 @@ created with Claude. Account: Burhan Ra'if Kouri
 
 import sys
 import json
+import bisect
 import os
 import time
+import threading
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
 import fitz  # PyMuPDF
+try:
+    import orjson  # Optional: much faster JSON for large annotation sets
+except ImportError:
+    orjson = None
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFileDialog, QScrollArea, QStatusBar, 
     QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsItem, QListWidget,
     QListWidgetItem, QMessageBox, QLineEdit, QDialog, QDialogButtonBox,
-    QFormLayout, QFrame, QTextEdit
+    QFormLayout, QFrame, QTextEdit, QStyledItemDelegate, QStyleOptionViewItem, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal, QTimer, QEvent
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor, QPen, QBrush, QMouseEvent, QFont, QCloseEvent, QCursor
+from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal, QTimer, QEvent, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QTransform, QPainter, QColor, QPen, QBrush, QMouseEvent, QFont, QCloseEvent, QCursor
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget  # Optional: GPU-composited page views
+except ImportError:
+    QOpenGLWidget = None
+
+# PDF documents opened by the viewers, shared when both show the same file: path -> [document, refcount, doc_id]
+# A doc_id outlives its document: reopening the file unchanged reuses it (see _DOC_IDS)
+_DOC_CACHE = {}
+_next_doc_id = 0
+# (path, size, mtime) -> doc_id, so reopening an unchanged file finds its pages still in QPixmapCache
+_DOC_IDS = {}
+# MuPDF is not thread-safe, so all document access (GUI and render threads, both viewers) is serialized
+DOCUMENT_LOCK = threading.Lock()
+# Cap for MuPDF's own store of decoded fonts/images; rendered pages are already cached as QPixmaps
+MUPDF_STORE_LIMIT = 64 << 20
+# Size of the QPixmapCache holding rendered pages for both viewers, in KB
+PIXMAP_CACHE_LIMIT_KB = 256 * 1024
+# Draw page views through OpenGL. Off by default: every page view gets its own GL context,
+# and remote/software-GL setups are slower than the raster path
+USE_OPENGL_VIEWPORT = False
+
+_RENDER_POOL = None
+# Reusable MuPDF render targets keyed by device-pixel rect; only touched under DOCUMENT_LOCK
+_RENDER_BUFFERS = {}
+RENDER_BUFFER_LIMIT = 4
+
+def render_pool():
+    """Thread pool for page renders, separate from the global pool used by auto-save"""
+    global _RENDER_POOL
+    if _RENDER_POOL is None:
+        _RENDER_POOL = QThreadPool()
+        # Renders serialize on DOCUMENT_LOCK anyway; more threads would just sit blocked on it
+        _RENDER_POOL.setMaxThreadCount(1)
+    return _RENDER_POOL
+
+def render_buffer(irect):
+    """Return a white RGB pixmap covering irect, reused across pages of the same rendered size"""
+    key = tuple(irect)
+    pix = _RENDER_BUFFERS.pop(key, None)
+    if pix is None:
+        pix = fitz.Pixmap(fitz.csRGB, irect, 0)
+        if len(_RENDER_BUFFERS) >= RENDER_BUFFER_LIMIT:
+            del _RENDER_BUFFERS[next(iter(_RENDER_BUFFERS))]  # Drop the least recently used size
+    _RENDER_BUFFERS[key] = pix
+    pix.clear_with(255)
+    return pix
+
+def release_render_buffers():
+    """Free the pooled render targets and empty MuPDF's store"""
+    with DOCUMENT_LOCK:
+        _RENDER_BUFFERS.clear()
+        fitz.TOOLS.store_shrink(100)
+
+def trim_document_store(percent=50):
+    """Shrink MuPDF's store once it passes MUPDF_STORE_LIMIT. Caller must hold DOCUMENT_LOCK."""
+    if fitz.TOOLS.store_size > MUPDF_STORE_LIMIT:
+        fitz.TOOLS.store_shrink(percent)
+
+def open_shared_document(file_path):
+    """Open a PDF, reusing the document if another viewer already has it open.
+    Returns (document, doc_id); doc_id keys the page cache and identifies the file's contents by
+    (path, size, mtime), so reopening an unchanged file gets the same id and finds its pages cached."""
+    global _next_doc_id
+    key = os.path.abspath(file_path)
+    with DOCUMENT_LOCK:
+        entry = _DOC_CACHE.get(key)
+        if entry is None:
+            stat = os.stat(key)
+            signature = (key, stat.st_size, stat.st_mtime_ns)
+            doc_id = _DOC_IDS.get(signature)
+            if doc_id is None:
+                _next_doc_id += 1
+                doc_id = _DOC_IDS[signature] = _next_doc_id
+            entry = _DOC_CACHE[key] = [fitz.open(key), 0, doc_id]
+        entry[1] += 1
+        return entry[0], entry[2]
+
+def release_shared_document(document):
+    """Drop one reference to a shared document, closing it once no viewer uses it"""
+    with DOCUMENT_LOCK:
+        for key, entry in _DOC_CACHE.items():
+            if entry[0] is document:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del _DOC_CACHE[key]
+                    document.close()
+                    trim_document_store(100)  # Fonts/images decoded for the closed file are now dead weight
+                return
 
 class SavePairDialog(QDialog):
     """Dialog for entering pair name when saving"""
@@ -56,21 +152,48 @@ class SavePairDialog(QDialog):
             'description': self.description_edit.toPlainText().strip()
         }
 
+def make_link_style(color, width=3, alpha=80):
+    """Build the (solid pen, dashed pen, brush) used to draw an annotation state"""
+    pen = QPen(color, width)
+    dashed_pen = QPen(pen)
+    dashed_pen.setStyle(Qt.PenStyle.DashLine)
+    brush = QBrush(QColor(color.red(), color.green(), color.blue(), alpha))
+    return pen, dashed_pen, brush
+
+# Link state styles, built once and shared by every annotation
+LINK_STATE_STYLES = {
+    "red": make_link_style(QColor(255, 0, 0)),          # Red for unlinked
+    "green": make_link_style(QColor(0, 255, 0)),        # Green for linked
+    "magenta": make_link_style(QColor(255, 0, 255)),    # Magenta for stem
+    "dark_red": make_link_style(QColor(139, 0, 0)),     # Dark Red for stem-linked questions without answers
+    "dark_green": make_link_style(QColor(0, 100, 0)),   # Dark Green for stem-linked questions with answers
+}
+
 class SelectableRect(QGraphicsRectItem):
     """Rectangle that can be selected and shows resize handles like MS Paint"""
     
-    def __init__(self, rect, pen, brush, page_widget=None, parent=None):
+    HANDLE_SIZE = 6
+    HANDLE_PEN = QPen(QColor(0, 0, 0), 1)
+    HANDLE_BRUSH = QBrush(QColor(255, 255, 255))
+    
+    def __init__(self, rect, pen, brush, page_widget=None, parent=None, selected_pen=None):
         super().__init__(rect, parent)
         self.setPen(pen)
         self.setBrush(brush)
         self.original_pen = pen
         self.original_brush = brush  # Store original brush
-        self.selected_pen = QPen(pen.color(), pen.width())
-        self.selected_pen.setStyle(Qt.PenStyle.DashLine)
+        if selected_pen is None:
+            selected_pen = QPen(pen)
+            selected_pen.setStyle(Qt.PenStyle.DashLine)
+        self.selected_pen = selected_pen
+        # Pens for the current look; selection just swaps between them
+        self.solid_pen = pen
+        self.dashed_pen = self.selected_pen
         self.is_selected = False
         self.page_widget = page_widget  # Reference to the page widget for notifications
         self.selection_id = None  # Unique selection ID
         self.page_index = None    # Page index where this selection exists
+        self._cached_y = None     # Scene Y of the top edge, computed lazily for navigation sorting
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, False)
         
@@ -79,115 +202,186 @@ class SelectableRect(QGraphicsRectItem):
         self.linked_pen = None
         self.linked_brush = None
         
-    def select(self):
-        self.is_selected = True
-        self.setPen(self.selected_pen)
+        self.handles = None  # Resize handle child items, created on first selection
+    
+    def update_handles(self):
+        """Show resize handles on the corners and edge midpoints while selected"""
+        if not self.is_selected:
+            if self.handles:
+                for handle in self.handles:
+                    handle.hide()
+            return
         
-    def deselect(self):
-        self.is_selected = False
-        self.setPen(self.original_pen)
+        if self.handles is None:
+            self.handles = []
+            for _ in range(8):
+                handle = QGraphicsRectItem(self)
+                handle.setPen(self.HANDLE_PEN)
+                handle.setBrush(self.HANDLE_BRUSH)
+                self.handles.append(handle)
+        
+        rect = self.rect()
+        left, right, top, bottom = rect.left(), rect.right(), rect.top(), rect.bottom()
+        center_x = (left + right) / 2
+        center_y = (top + bottom) / 2
+        size = self.HANDLE_SIZE
+        points = ((left, top), (center_x, top), (right, top), (right, center_y),
+                  (right, bottom), (center_x, bottom), (left, bottom), (left, center_y))
+        for handle, (x, y) in zip(self.handles, points):
+            handle.setRect(x - size / 2, y - size / 2, size, size)
+            handle.show()
+    
+    def apply_style(self, pen, dashed_pen, brush):
+        """Switch to a new solid/dashed pen pair and brush, keeping the selection look"""
+        self.solid_pen = pen
+        self.dashed_pen = dashed_pen
+        self.setPen(dashed_pen if self.is_selected else pen)
+        self.setBrush(brush)
     
     def set_linked_highlight(self, is_linked: bool):
         """Set temporary highlight when Selection ID is captured"""
         if is_linked:
             # Change to yellow highlight
             self.is_linked = True
-            self.linked_pen = QPen(QColor(255, 255, 0), self.original_pen.width())  # Yellow pen
-            self.linked_brush = QBrush(QColor(255, 255, 0, 100))  # Semi-transparent yellow
-            self.setPen(self.linked_pen)
-            self.setBrush(self.linked_brush)
+            self.linked_pen, linked_dashed_pen, self.linked_brush = make_link_style(
+                QColor(255, 255, 0), self.original_pen.width(), 100)  # Semi-transparent yellow
+            self.apply_style(self.linked_pen, linked_dashed_pen, self.linked_brush)
         else:
             # Restore original appearance
             self.is_linked = False
-            self.setPen(self.original_pen)
-            self.setBrush(self.original_brush)
+            self.apply_style(self.original_pen, self.selected_pen, self.original_brush)
     
     def set_link_state(self, state: str):
         """Set the visual state based on linking status"""
         # Store the link state for later reference
         self.current_link_state = state
         
-        if state == "red":
-            # Red for unlinked
-            pen = QPen(QColor(255, 0, 0), 3)
-            brush = QBrush(QColor(255, 0, 0, 80))
-        elif state == "green":
-            # Green for linked
-            pen = QPen(QColor(0, 255, 0), 3)
-            brush = QBrush(QColor(0, 255, 0, 80))
-        elif state == "magenta":
-            # Magenta for stem
-            pen = QPen(QColor(255, 0, 255), 3)
-            brush = QBrush(QColor(255, 0, 255, 80))
-        elif state == "dark_red":
-            # Dark Red for stem-linked questions without answers
-            pen = QPen(QColor(139, 0, 0), 3)
-            brush = QBrush(QColor(139, 0, 0, 80))
-        elif state == "dark_green":
-            # Dark Green for stem-linked questions with answers
-            pen = QPen(QColor(0, 100, 0), 3)
-            brush = QBrush(QColor(0, 100, 0, 80))
-        else:
+        style = LINK_STATE_STYLES.get(state)
+        if style is None:
             # Default to original
-            pen = self.original_pen
-            brush = self.original_brush
+            style = (self.original_pen, self.selected_pen, self.original_brush)
         
-        # Always update the pen and brush
-        self.setPen(pen)
-        self.setBrush(brush)
-        
-        # If currently selected, make it dashed
-        if self.is_selected:
-            pen.setStyle(Qt.PenStyle.DashLine)
-            self.setPen(pen)
+        # Always update the pen and brush (dashed if currently selected)
+        self.apply_style(*style)
     
     def select(self):
         self.is_selected = True
-        # Make current pen dashed for selection
-        current_pen = self.pen()
-        current_pen.setStyle(Qt.PenStyle.DashLine)
-        self.setPen(current_pen)
+        self.setPen(self.dashed_pen)
+        self.update_handles()
         
     def deselect(self):
         self.is_selected = False
+        self.update_handles()
         # Restore the link state when deselected
         if hasattr(self, 'current_link_state') and self.current_link_state:
             self.set_link_state(self.current_link_state)
         else:
-            self.setPen(self.original_pen)
-            self.setBrush(self.original_brush)
+            self.apply_style(self.original_pen, self.selected_pen, self.original_brush)
+        
+    def scene_rect(self):
+        """Rect in scene coordinates (rect offset by pos), without the pen width sceneBoundingRect adds"""
+        return self.mapRectToScene(self.rect())
+        
+    def top_y(self):
+        """Cached top edge Y position (rect + pos), recomputed only after a move/resize"""
+        if self._cached_y is None:
+            self._cached_y = self.scene_rect().y()
+        return self._cached_y
         
     def setRect(self, rect):
         super().setRect(rect)
+        self._cached_y = None
+        if self.is_selected:
+            self.update_handles()
         if self.page_widget:
+            self.page_widget.annotation_mutated.emit(self, 'moved')
             self.page_widget.emit_annotation_modified()
         
     def setPos(self, pos):
         super().setPos(pos)
+        self._cached_y = None
         if self.page_widget:
+            self.page_widget.annotation_mutated.emit(self, 'moved')
             self.page_widget.emit_annotation_modified()
 
+class PageRenderSignals(QObject):
+    """Signals for delivering rasterized pages back to the GUI thread"""
+    finished = pyqtSignal(int, int, int, QImage)  # (generation, page_index, rotation, image at its device pixel ratio)
+
+class PageRenderJob(QRunnable):
+    """Rasterizes a single PDF page off the GUI thread"""
+    
+    def __init__(self, document, index, rotation, matrix, dpr, lock, generation, signals):
+        super().__init__()
+        self.document = document
+        self.index = index
+        self.rotation = rotation
+        self.matrix = matrix
+        self.dpr = dpr
+        self.lock = lock
+        self.generation = generation
+        self.signals = signals
+        self.cancelled = False  # Set from the GUI thread when the page no longer needs this render
+    
+    def run(self):
+        try:
+            # MuPDF is not thread-safe, so document access is serialized
+            with self.lock:
+                if self.cancelled:
+                    return
+                if self.document.is_closed:
+                    return  # Viewer moved on to another file before this job ran
+                page = self.document[self.index]
+                # Draw into a pooled buffer instead of letting get_pixmap allocate one per page
+                pix = render_buffer((page.rect * self.matrix).irect)
+                device = fitz.Device(pix, None)
+                page.run(device, self.matrix)
+                device.close()
+                # Wrap the samples without copying; converting to the native 32-bit format here
+                # detaches from the pooled buffer and leaves no conversion for the GUI thread
+                qimg = QImage(pix.samples_mv, pix.width, pix.height, pix.stride,
+                              QImage.Format.Format_RGB888).convertToFormat(QImage.Format.Format_RGB32)
+                del pix, page
+                # Keep MuPDF's store from growing with the document (scanned books can reach GBs)
+                trim_document_store()
+            qimg.setDevicePixelRatio(self.dpr)  # Drawn at the page's logical size
+            self.signals.finished.emit(self.generation, self.index, self.rotation, qimg)
+        except Exception as e:
+            print(f"Error rendering page {self.index + 1}: {e}")
+
 class PDFPage(QGraphicsView):
     """Custom widget for displaying a PDF page with MS Paint-style rectangle annotations"""
     
     annotation_modified = pyqtSignal()  # Signal when annotations are modified
     annotation_created = pyqtSignal()   # Signal when a new annotation is created (for lock mode)
     selection_changed = pyqtSignal()    # Signal when selection changes
+    annotation_mutated = pyqtSignal(object, str)  # (annotation, 'added'/'removed'/'moved') for incremental updates
+    annotation_layout_changed = pyqtSignal()  # Annotations re-laid out for a view change (rotation); nothing to save
 
     def __init__(self, page, index: int, owner, annotation_color: QColor, parent=None):
         super().__init__(parent)
-        self.scene = QGraphicsScene()
+        self.scene = QGraphicsScene(self)  # Owned by the view, so it goes with deleteLater()
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)  # Used for click hit-testing
         self.setScene(self.scene)
         self.pixmap_item = None
+        self.placeholder_rect = None
+        self.placeholder_label = None
         
         # Drawing state
         self.drawing = False
         self.start_point = None
         self.temp_rect = None
+        self.pending_draw_point = None
+        self.draw_timer = None  # Created on first draw; most pages are never drawn on
         
         # NEW: Lazy loading state
         self.is_rendered = False
-        self.page_document = page  # Store page reference
+        self.render_pending = None  # Cache key of the in-flight background render, if any
+        self.render_job = None
+        # Only the size is kept: render jobs load the page themselves, and holding a fitz.Page
+        # per widget would keep every page's object tree alive in MuPDF
+        with owner.render_lock:
+            self.page_rect = page.rect  # Read once; the document may be busy on a render thread
         
         # Selection and resize state
         self.selected_rect = None
@@ -196,20 +390,37 @@ class PDFPage(QGraphicsView):
         
         self.annotations = []
         self.rotation = 0
-        self.page = page
         self.index = index
         self.owner = owner
         self.annotation_mode = False
         self.page_width = 0
         self.page_height = 0
+        self.annotation_rotation = 0  # Rotation the annotation items are currently laid out for
 
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+        
+        if USE_OPENGL_VIEWPORT and QOpenGLWidget is not None:
+            self.setViewport(QOpenGLWidget())
+        
+        # Repainting the viewport in one go is cheaper than diffing regions for each drag step
+        # (and is what OpenGL viewports require)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontSavePainterState |
+            QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing)
 
         # Annotation settings
         self.annotation_color = annotation_color
         self.annotation_width = 2
         self.handle_size = 6
+        
+        # Shared by every annotation on this page instead of being rebuilt per rectangle
+        self.annotation_pen = QPen(annotation_color, self.annotation_width)
+        self.annotation_selected_pen = QPen(self.annotation_pen)
+        self.annotation_selected_pen.setStyle(Qt.PenStyle.DashLine)
+        self.annotation_brush = QBrush(QColor(annotation_color.red(), annotation_color.green(),
+                                              annotation_color.blue(), 50))
 
         self.render_page()
 
@@ -217,76 +428,156 @@ class PDFPage(QGraphicsView):
         """Emit signal that annotations were modified"""
         self.annotation_modified.emit()
 
-    def render_placeholder(self):
-        """Render a lightweight placeholder for unloaded pages"""
-        # Get page dimensions without rendering (very fast)
-        rect = self.page_document.rect
-        width = int(rect.width)
-        height = int(rect.height)
+    def page_matrix(self, scale=1):
+        """Matrix used to rasterize this page at its current rotation"""
+        return fitz.Matrix(scale, scale).prerotate(self.rotation)
+
+    def logical_size(self):
+        """Page size in scene units at the current rotation, without rasterizing"""
+        irect = (self.page_rect * self.page_matrix()).irect
+        return irect.width, irect.height
+
+    @staticmethod
+    def rotate_relative(x, y, width, height, rotation):
+        """Map a relative rect onto the same page rotated clockwise by rotation degrees"""
+        if rotation == 90:
+            return 1 - y - height, x, height, width
+        if rotation == 180:
+            return 1 - x - width, 1 - y - height, width, height
+        if rotation == 270:
+            return y, 1 - x - width, height, width
+        return x, y, width, height
+
+    def set_page_size(self, width, height):
+        """Resize the scene to the page, re-laying out annotations if the size or rotation changed"""
+        if (width, height) == (self.page_width, self.page_height) and self.annotation_rotation == self.rotation:
+            return
+        if height != self.page_height:
+            self.owner.page_geometry = None  # Page offsets in the viewer shift
+        rotated = self.annotation_rotation != self.rotation
+        
+        if self.annotations and self.page_width > 0:
+            # Move existing items in place so selection, links and navigation keep pointing at them
+            for ann in self.annotations:
+                rect = ann.scene_rect()
+                rel = self.rotate_relative(
+                    rect.x() / self.page_width, rect.y() / self.page_height,
+                    rect.width() / self.page_width, rect.height() / self.page_height,
+                    (self.rotation - self.annotation_rotation) % 360)
+                QGraphicsRectItem.setPos(ann, QPointF(0, 0))
+                QGraphicsRectItem.setRect(ann, QRectF(rel[0] * width, rel[1] * height, rel[2] * width, rel[3] * height))
+                ann._cached_y = None
+                if ann.is_selected:
+                    ann.update_handles()
         
         self.page_width = width
         self.page_height = height
-        
-        # Create gray placeholder
-        placeholder = QPixmap(width, height)
-        placeholder.fill(QColor(240, 240, 240))
-        
-        # Draw page number
-        painter = QPainter(placeholder)
-        painter.setPen(QColor(150, 150, 150))
-        font = QFont()
-        font.setPointSize(max(12, height // 50))
-        painter.setFont(font)
-        painter.drawText(placeholder.rect(), Qt.AlignmentFlag.AlignCenter, 
-                        f"Page {self.index + 1}")
-        painter.end()
-        
-        self.scene.clear()
-        self.pixmap_item = self.scene.addPixmap(placeholder)
-        self.scene.setSceneRect(QRectF(placeholder.rect()))
+        self.annotation_rotation = self.rotation
+        self.scene.setSceneRect(QRectF(0, 0, width, height))
         self.setMinimumHeight(height + 20)
+        
+        if rotated and self.annotations:
+            self.annotation_layout_changed.emit()  # Navigation order follows the new layout
+
+    def render_placeholder(self):
+        """Render a lightweight placeholder for unloaded pages"""
+        # Page size comes from the page geometry, nothing is rasterized
+        width, height = self.logical_size()
+        self.set_page_size(width, height)
+        
+        # Release the rendered pixmap but keep the item and the annotations in the scene
+        if self.pixmap_item is not None:
+            self.pixmap_item.setPixmap(QPixmap())
+        
+        # Gray page rect with the page number instead of a full-size pixmap
+        if self.placeholder_rect is None:
+            self.placeholder_rect = self.scene.addRect(
+                QRectF(0, 0, width, height), QPen(Qt.PenStyle.NoPen), QBrush(QColor(240, 240, 240)))
+            self.placeholder_rect.setZValue(-1)
+            font = QFont()
+            font.setPointSize(max(12, height // 50))
+            self.placeholder_label = self.scene.addSimpleText(f"Page {self.index + 1}", font)
+            self.placeholder_label.setBrush(QBrush(QColor(150, 150, 150)))
+            self.placeholder_label.setZValue(-1)
+        else:
+            self.placeholder_rect.setRect(QRectF(0, 0, width, height))
+            self.placeholder_rect.show()
+            self.placeholder_label.show()
+        label_rect = self.placeholder_label.boundingRect()
+        self.placeholder_label.setPos((width - label_rect.width()) / 2, (height - label_rect.height()) / 2)
+        
         self.is_rendered = False
+        self.render_pending = None
+        if self.render_job is not None:
+            self.render_job.cancelled = True  # Skip it if it hasn't started yet
+            self.render_job = None
         
         # Don't clear annotations - they persist across render states
     
-    def render_full(self):
+    def unrender(self):
+        """Release the rendered pixmap and fall back to the placeholder"""
+        self.render_placeholder()
+    
+    def render_full(self, priority=0):
             """Render the actual PDF page content"""
             if self.is_rendered:
                 return  # Already rendered
                 
-            mat = fitz.Matrix(1, 1).prerotate(self.rotation)
-            pix = self.page_document.get_pixmap(matrix=mat, alpha=False)
-            img_data = pix.tobytes("ppm")
-            qimg = QImage.fromData(img_data)
-            qpixmap = QPixmap.fromImage(qimg)
-    
-            self.page_width = qpixmap.width()
-            self.page_height = qpixmap.height()
-    
-            # Save annotation data before clearing (scene.clear() deletes Qt objects)
-            annotations_data = self.get_annotations_data()
-            was_selected_id = None
-            if self.selected_rect and hasattr(self.selected_rect, 'selection_id'):
-                was_selected_id = self.selected_rect.selection_id
-            
-            self.scene.clear()
-            self.pixmap_item = self.scene.addPixmap(qpixmap)
-            self.scene.setSceneRect(QRectF(qpixmap.rect()))
-            self.setMinimumHeight(qpixmap.height() + 20)
-            
-            # Recreate annotations from saved data
-            self.annotations = []
-            self.selected_rect = None
-            if annotations_data:
-                self.load_annotations(annotations_data)
-                
-                # Restore selection if there was one
-                if was_selected_id:
-                    for ann in self.annotations:
-                        if hasattr(ann, 'selection_id') and ann.selection_id == was_selected_id:
-                            self.selected_rect = ann
-                            ann.select()
-                            break
+            # Rasterize at the screen's pixel density so HiDPI pages are sharp, not upscaled
+            dpr = self.devicePixelRatioF()
+            cache_key = (self.index, self.rotation, dpr)
+            qpixmap = self.owner.get_cached_pixmap(cache_key)
+            if qpixmap is None:
+                qpixmap = self.rotated_from_cache(dpr)
+            if qpixmap is not None:
+                self.show_pixmap(qpixmap)
+                return
+            
+            # Rasterize in the background; the placeholder stays up until it arrives
+            if self.render_pending == cache_key:
+                return  # Already queued
+            self.render_pending = cache_key
+            self.render_job = PageRenderJob(
+                self.owner.pdf_document, self.index, self.rotation, self.page_matrix(dpr), dpr,
+                self.owner.render_lock, self.owner.render_generation, self.owner.render_signals)
+            render_pool().start(self.render_job, priority)
+    
+    def rotated_from_cache(self, dpr):
+        """Build this rotation from a cached render at another rotation, if there is one.
+        Quarter turns only permute pixels, so this matches a fresh MuPDF render."""
+        for cached_rotation in (0, 90, 180, 270):
+            if cached_rotation == self.rotation:
+                continue
+            base = self.owner.get_cached_pixmap((self.index, cached_rotation, dpr))
+            if base is not None:
+                qpixmap = base.transformed(QTransform().rotate(self.rotation - cached_rotation))
+                qpixmap.setDevicePixelRatio(dpr)
+                self.owner.cache_pixmap((self.index, self.rotation, dpr), qpixmap)
+                return qpixmap
+        return None
+    
+    def on_render_finished(self, cache_key, qpixmap):
+        """Show a background render if it still matches what this page wants"""
+        if self.render_pending != cache_key or cache_key[1] != self.rotation:
+            return  # Stale: the page was rotated or unloaded meanwhile
+        self.render_pending = None
+        self.render_job = None
+        self.show_pixmap(qpixmap)
+    
+    def show_pixmap(self, qpixmap):
+            """Replace the placeholder with a rendered page pixmap"""
+            self.set_page_size(*self.logical_size())
+            
+            # Swap the placeholder for the page pixmap, underneath the annotations
+            if self.placeholder_rect is not None:
+                self.placeholder_rect.hide()
+                self.placeholder_label.hide()
+            if self.pixmap_item is None:
+                self.pixmap_item = self.scene.addPixmap(qpixmap)
+                self.pixmap_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
+                self.pixmap_item.setZValue(-1)
+            else:
+                self.pixmap_item.setPixmap(qpixmap)
             
             self.is_rendered = True
     
@@ -299,22 +590,19 @@ class PDFPage(QGraphicsView):
         for ann_data in annotation_data:
             coords = ann_data['coordinates']
             
+            # Saved coordinates are for the unrotated page; map them onto the current layout
+            rel_x, rel_y, rel_width, rel_height = self.rotate_relative(
+                coords['x'], coords['y'], coords['width'], coords['height'], self.annotation_rotation)
+            
             # Convert relative coordinates to absolute pixel coordinates
-            x = coords['x'] * self.page_width
-            y = coords['y'] * self.page_height
-            width = coords['width'] * self.page_width
-            height = coords['height'] * self.page_height
+            x = rel_x * self.page_width
+            y = rel_y * self.page_height
+            width = rel_width * self.page_width
+            height = rel_height * self.page_height
             
             rect = QRectF(x, y, width, height)
-            pen = QPen(self.annotation_color, self.annotation_width)
-            brush = QBrush(QColor(
-                self.annotation_color.red(),
-                self.annotation_color.green(),
-                self.annotation_color.blue(),
-                50
-            ))
-            
-            annotation = SelectableRect(rect, pen, brush, page_widget=self)
+            annotation = SelectableRect(rect, self.annotation_pen, self.annotation_brush, page_widget=self,
+                                        selected_pen=self.annotation_selected_pen)
             
             # Store the selection ID and page information in the annotation object
             if 'selection_id' in ann_data:
@@ -345,12 +633,11 @@ class PDFPage(QGraphicsView):
         """Convert annotations to relative coordinates for saving"""
         annotations_data = []
         for annotation in self.annotations:
-            rect = annotation.rect()
-            pos = annotation.pos()
+            rect = annotation.scene_rect()
             
             # Calculate absolute coordinates
-            abs_x = rect.x() + pos.x()
-            abs_y = rect.y() + pos.y()
+            abs_x = rect.x()
+            abs_y = rect.y()
             abs_width = rect.width()
             abs_height = rect.height()
             
@@ -360,6 +647,10 @@ class PDFPage(QGraphicsView):
             rel_width = abs_width / self.page_width if self.page_width > 0 else 0
             rel_height = abs_height / self.page_height if self.page_height > 0 else 0
             
+            # Always save in the unrotated page frame, rotation is only a view setting
+            rel_x, rel_y, rel_width, rel_height = self.rotate_relative(
+                rel_x, rel_y, rel_width, rel_height, (360 - self.annotation_rotation) % 360)
+            
             # Use existing selection_id if available, otherwise generate and store it
             if hasattr(annotation, 'selection_id') and annotation.selection_id:
                 selection_id = annotation.selection_id
@@ -391,8 +682,17 @@ class PDFPage(QGraphicsView):
         return f"sel_{hash_object.hexdigest()[:12]}"
 
     def rotate(self, angle):
-        self.rotation = (self.rotation + angle) % 360
+        self.set_rotation((self.rotation + angle) % 360)
+
+    def set_rotation(self, rotation):
+        """Show the page at an absolute rotation, re-rendering it only if it was showing"""
+        if rotation == self.rotation:
+            return
+        was_rendered = self.is_rendered
+        self.rotation = rotation
         self.render_page()
+        if was_rendered:
+            self.render_full()  # Instant when this orientation is cached
 
     def set_annotation_mode(self, enabled: bool):
         self.annotation_mode = enabled
@@ -406,46 +706,65 @@ class PDFPage(QGraphicsView):
         if not rect_item.is_selected:
             return None
             
-        rect = rect_item.rect()
-        h = self.handle_size
-        
-        rect_pos = rect_item.pos()
-        adjusted_rect = QRectF(rect.x() + rect_pos.x(), rect.y() + rect_pos.y(), rect.width(), rect.height())
-        
-        handles = {
-            'nw': QRectF(adjusted_rect.left() - h/2, adjusted_rect.top() - h/2, h, h),
-            'n':  QRectF(adjusted_rect.center().x() - h/2, adjusted_rect.top() - h/2, h, h),
-            'ne': QRectF(adjusted_rect.right() - h/2, adjusted_rect.top() - h/2, h, h),
-            'e':  QRectF(adjusted_rect.right() - h/2, adjusted_rect.center().y() - h/2, h, h),
-            'se': QRectF(adjusted_rect.right() - h/2, adjusted_rect.bottom() - h/2, h, h),
-            's':  QRectF(adjusted_rect.center().x() - h/2, adjusted_rect.bottom() - h/2, h, h),
-            'sw': QRectF(adjusted_rect.left() - h/2, adjusted_rect.bottom() - h/2, h, h),
-            'w':  QRectF(adjusted_rect.left() - h/2, adjusted_rect.center().y() - h/2, h, h),
-        }
-        
-        for handle_name, handle_rect in handles.items():
-            if handle_rect.contains(pos):
+        rect = rect_item.scene_rect()
+        half = self.handle_size / 2
+        x = pos.x()
+        y = pos.y()
+        
+        # Handle anchor points in the same priority order as before; a handle is hit when the
+        # cursor is within half a handle of its anchor on both axes
+        left, right, top, bottom = rect.left(), rect.right(), rect.top(), rect.bottom()
+        center_x = (left + right) / 2
+        center_y = (top + bottom) / 2
+        for handle_name, handle_x, handle_y in (
+            ('nw', left, top), ('n', center_x, top), ('ne', right, top), ('e', right, center_y),
+            ('se', right, bottom), ('s', center_x, bottom), ('sw', left, bottom), ('w', left, center_y),
+        ):
+            if abs(x - handle_x) <= half and abs(y - handle_y) <= half:
                 return handle_name
                 
-        if adjusted_rect.contains(pos):
+        if rect.contains(pos):
             return 'move'
             
         return None
 
+    HANDLE_CURSORS = {
+        'nw': Qt.CursorShape.SizeFDiagCursor,
+        'n':  Qt.CursorShape.SizeVerCursor,
+        'ne': Qt.CursorShape.SizeBDiagCursor,
+        'e':  Qt.CursorShape.SizeHorCursor,
+        'se': Qt.CursorShape.SizeFDiagCursor,
+        's':  Qt.CursorShape.SizeVerCursor,
+        'sw': Qt.CursorShape.SizeBDiagCursor,
+        'w':  Qt.CursorShape.SizeHorCursor,
+        'move': Qt.CursorShape.SizeAllCursor
+    }
+
     def get_cursor_for_handle(self, handle):
         """Get cursor for handle type"""
-        cursors = {
-            'nw': Qt.CursorShape.SizeFDiagCursor,
-            'n':  Qt.CursorShape.SizeVerCursor,
-            'ne': Qt.CursorShape.SizeBDiagCursor,
-            'e':  Qt.CursorShape.SizeHorCursor,
-            'se': Qt.CursorShape.SizeFDiagCursor,
-            's':  Qt.CursorShape.SizeVerCursor,
-            'sw': Qt.CursorShape.SizeBDiagCursor,
-            'w':  Qt.CursorShape.SizeHorCursor,
-            'move': Qt.CursorShape.SizeAllCursor
-        }
-        return cursors.get(handle, Qt.CursorShape.ArrowCursor)
+        return self.HANDLE_CURSORS.get(handle, Qt.CursorShape.ArrowCursor)
+
+    def annotation_at(self, scene_pos):
+        """Annotation under a scene position, using the scene's BSP index instead of testing every rect"""
+        hits = set()
+        for item in self.scene.items(scene_pos):
+            if isinstance(item, SelectableRect) and item is not self.temp_rect:
+                if item.scene_rect().contains(scene_pos):
+                    hits.add(item)
+        
+        if len(hits) == 1:
+            return hits.pop()
+        if hits:
+            # Overlapping rects: keep the first-created one, as before
+            return next((rect for rect in self.annotations if rect in hits), None)
+        return None
+
+    def apply_pending_draw(self):
+        """Resize the rectangle being drawn to the latest mouse position"""
+        if self.pending_draw_point is not None and self.drawing and self.temp_rect:
+            # Base setRect: the rect isn't an annotation yet, so no change signals per mouse move
+            QGraphicsRectItem.setRect(self.temp_rect, QRectF(self.start_point, self.pending_draw_point).normalized())
+        self.pending_draw_point = None
 
     def mousePressEvent(self, event: QMouseEvent):
         app = self.window()
@@ -465,14 +784,7 @@ class PDFPage(QGraphicsView):
                 self.setCursor(self.get_cursor_for_handle(handle))
                 return
         
-        clicked_rect = None
-        for rect in self.annotations:
-            rect_pos = rect.pos()
-            adjusted_rect = QRectF(rect.rect().x() + rect_pos.x(), rect.rect().y() + rect_pos.y(), 
-                                 rect.rect().width(), rect.rect().height())
-            if adjusted_rect.contains(scene_pos):
-                clicked_rect = rect
-                break
+        clicked_rect = self.annotation_at(scene_pos)
         
         if clicked_rect:
             # Ensure only one selection exists in this viewer (across all pages)
@@ -509,14 +821,9 @@ class PDFPage(QGraphicsView):
             if self.annotation_mode and event.button() == Qt.MouseButton.LeftButton:
                 self.drawing = True
                 self.start_point = scene_pos
-                pen = QPen(self.annotation_color, self.annotation_width)
-                brush = QBrush(QColor(
-                    self.annotation_color.red(),
-                    self.annotation_color.green(),
-                    self.annotation_color.blue(),
-                    50
-                ))
-                self.temp_rect = SelectableRect(QRectF(scene_pos, scene_pos), pen, brush, page_widget=self)
+                self.temp_rect = SelectableRect(QRectF(scene_pos, scene_pos), self.annotation_pen,
+                                                self.annotation_brush, page_widget=self,
+                                                selected_pen=self.annotation_selected_pen)
                 self.scene.addItem(self.temp_rect)
                 self.setCursor(Qt.CursorShape.CrossCursor)
 
@@ -530,17 +837,23 @@ class PDFPage(QGraphicsView):
         scene_pos = self.mapToScene(event.pos())
         
         if self.drawing and self.temp_rect:
-            rect = QRectF(self.start_point, scene_pos).normalized()
-            self.temp_rect.setRect(rect)
+            # Apply at most once per frame; fast mouse moves only update the pending point
+            self.pending_draw_point = scene_pos
+            if self.draw_timer is None:
+                self.draw_timer = QTimer()
+                self.draw_timer.setSingleShot(True)
+                self.draw_timer.setInterval(16)
+                self.draw_timer.timeout.connect(self.apply_pending_draw)
+            if not self.draw_timer.isActive():
+                self.draw_timer.start()
             super().mouseMoveEvent(event)
             return
         
         if self.selected_rect and self.resize_mode and self.last_mouse_pos:
-            self.viewport().update()
+            # The item change schedules the repaint (handles included) - no manual updates needed
             delta = scene_pos - self.last_mouse_pos
             self.resize_rectangle(delta)
             self.last_mouse_pos = scene_pos
-            self.viewport().update()
             return
         
         if self.selected_rect:
@@ -552,16 +865,7 @@ class PDFPage(QGraphicsView):
             else:
                 self.setCursor(Qt.CursorShape.ArrowCursor)
         else:
-            over_rect = False
-            for rect in self.annotations:
-                rect_pos = rect.pos()
-                adjusted_rect = QRectF(rect.rect().x() + rect_pos.x(), rect.rect().y() + rect_pos.y(), 
-                                     rect.rect().width(), rect.rect().height())
-                if adjusted_rect.contains(scene_pos):
-                    over_rect = True
-                    break
-            
-            if over_rect:
+            if self.annotation_at(scene_pos) is not None:
                 self.setCursor(Qt.CursorShape.ArrowCursor)
             elif self.annotation_mode:
                 self.setCursor(Qt.CursorShape.CrossCursor)
@@ -576,6 +880,9 @@ class PDFPage(QGraphicsView):
             return
 
         if self.drawing and self.temp_rect:
+            if self.draw_timer is not None:
+                self.draw_timer.stop()
+            self.apply_pending_draw()
             self.drawing = False
             rect = self.temp_rect.rect()
             if rect.width() > 5 and rect.height() > 5:
@@ -598,6 +905,7 @@ class PDFPage(QGraphicsView):
                 self.selected_rect = self.temp_rect
                 self.selected_rect.select()
                 self.selection_changed.emit()  # Emit selection changed signal
+                self.annotation_mutated.emit(self.temp_rect, 'added')
                 self.emit_annotation_modified()  # Existing annotation modified signal
                 self.annotation_created.emit()   # NEW: Signal for lock mode
             else:
@@ -637,8 +945,6 @@ class PDFPage(QGraphicsView):
             
             if new_rect.width() > 10 and new_rect.height() > 10:
                 self.selected_rect.setRect(new_rect)
-        
-        self.viewport().update()
 
     def keyPressEvent(self, event):
         app = self.window()
@@ -647,8 +953,11 @@ class PDFPage(QGraphicsView):
 
         if event.key() == Qt.Key.Key_Delete and self.selected_rect:
             self.scene.removeItem(self.selected_rect)
-            if self.selected_rect in self.annotations:
+            try:
                 self.annotations.remove(self.selected_rect)
+            except ValueError:
+                pass
+            self.annotation_mutated.emit(self.selected_rect, 'removed')
             self.selected_rect = None
             self.selection_changed.emit()  # Emit selection changed signal
             self.emit_annotation_modified()  # Annotation deleted
@@ -675,9 +984,10 @@ class PDFPage(QGraphicsView):
         # NEW: S key binding for marking/unmarking stems
         elif event.key() == Qt.Key.Key_S:
             # Check if we're in link mode
-            if hasattr(app, 'link_screen') and app.link_screen:
+            link_screen = app.active_link_screen() if hasattr(app, 'active_link_screen') else None
+            if link_screen is not None:
                 # We're in link mode, use the link screen's handle_s_key method
-                app.link_screen.handle_s_key()
+                link_screen.handle_s_key()
             else:
                 # We're in main viewer mode, use the main app's handle_s_key method
                 app.handle_s_key()
@@ -685,9 +995,10 @@ class PDFPage(QGraphicsView):
         # NEW: R key binding for removing questions from stems
         elif event.key() == Qt.Key.Key_R:
             # Check if we're in link mode
-            if hasattr(app, 'link_screen') and app.link_screen:
+            link_screen = app.active_link_screen() if hasattr(app, 'active_link_screen') else None
+            if link_screen is not None:
                 # We're in link mode, use the link screen's handle_r_key method
-                app.link_screen.handle_r_key()
+                link_screen.handle_r_key()
             else:
                 # We're in main viewer mode, use the main app's handle_r_key method
                 app.handle_r_key()
@@ -705,9 +1016,10 @@ class PDFPage(QGraphicsView):
             
         # Get the parent app to access the link screen
         app = self.window()
-        if hasattr(app, 'link_screen'):
+        link_screen = app.active_link_screen() if hasattr(app, 'active_link_screen') else None
+        if link_screen is not None:
             # We're in Link Mode, use the link screen's capture method
-            app.link_screen.capture_selection_id(selection_id, self.selected_rect, self.owner.viewer_id, self.index)
+            link_screen.capture_selection_id(selection_id, self.selected_rect, self.owner.viewer_id, self.index)
         else:
             # We're in main viewer mode, capture directly
             self.capture_selection_id_directly(selection_id, self.selected_rect, self.owner.viewer_id, self.index)
@@ -796,11 +1108,15 @@ class PDFPage(QGraphicsView):
                 app.status_bar.showMessage(f"Error capturing Selection ID: {e}", 3000)
     
     def clear_annotations(self):
+        # Drop the BSP index while removing, rather than updating it once per item; it is rebuilt
+        # lazily from the few items left (page pixmap/placeholder) on the next hit-test
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         for ann in self.annotations:
             # Clear pending link flag if it exists
             if hasattr(ann, 'is_pending_link'):
                 ann.is_pending_link = False
             self.scene.removeItem(ann)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
         self.annotations.clear()
         if self.selected_rect:
             self.selected_rect.deselect()
@@ -812,12 +1128,11 @@ class PDFPage(QGraphicsView):
         """Ensure all annotations have selection IDs (for backward compatibility)"""
         for annotation in self.annotations:
             if not hasattr(annotation, 'selection_id') or annotation.selection_id is None:
-                rect = annotation.rect()
-                pos = annotation.pos()
+                rect = annotation.scene_rect()
                 
                 # Calculate relative coordinates
-                abs_x = rect.x() + pos.x()
-                abs_y = rect.y() + pos.y()
+                abs_x = rect.x()
+                abs_y = rect.y()
                 abs_width = rect.width()
                 abs_height = rect.height()
                 
@@ -829,40 +1144,6 @@ class PDFPage(QGraphicsView):
                 annotation.selection_id = self.generate_selection_id(rel_x, rel_y, rel_width, rel_height, self.index)
                 annotation.page_index = self.index
 
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        
-        if self.selected_rect and self.selected_rect.is_selected:
-            painter = QPainter(self.viewport())
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            
-            rect = self.selected_rect.rect()
-            rect_pos = self.selected_rect.pos()
-            scene_rect = QRectF(rect.x() + rect_pos.x(), rect.y() + rect_pos.y(), rect.width(), rect.height())
-            viewport_rect = self.mapFromScene(scene_rect).boundingRect()
-            
-            handle_size = 6
-            pen = QPen(QColor(0, 0, 0), 1)
-            brush = QBrush(QColor(255, 255, 255))
-            painter.setPen(pen)
-            painter.setBrush(brush)
-            
-            handles = [
-                QPointF(viewport_rect.left(), viewport_rect.top()),
-                QPointF(viewport_rect.center().x(), viewport_rect.top()),
-                QPointF(viewport_rect.right(), viewport_rect.top()),
-                QPointF(viewport_rect.right(), viewport_rect.center().y()),
-                QPointF(viewport_rect.right(), viewport_rect.bottom()),
-                QPointF(viewport_rect.center().x(), viewport_rect.bottom()),
-                QPointF(viewport_rect.left(), viewport_rect.bottom()),
-                QPointF(viewport_rect.left(), viewport_rect.center().y())
-            ]
-            
-            for handle_pos in handles:
-                handle_rect = QRectF(handle_pos.x() - handle_size/2, handle_pos.y() - handle_size/2, 
-                                   handle_size, handle_size)
-                painter.drawRect(handle_rect)
-
     def clear_linked_highlighting(self):
         """Clear linked highlighting from all annotations"""
         # This method is not needed in PDFPage class
@@ -880,6 +1161,8 @@ class PDFViewer(QWidget):
     annotations_changed = pyqtSignal()  # Signal when any annotations change
     annotation_created = pyqtSignal()   # Signal when a new annotation is created (for lock mode)
     selection_changed = pyqtSignal()    # Signal when selection changes
+    annotation_mutated = pyqtSignal(object, str)  # Relayed from pages for incremental navigation updates
+    annotation_layout_changed = pyqtSignal()  # Relayed from pages when rotation moved their annotations
     pdf_loaded = pyqtSignal()          # Signal when PDF is loaded
 
     def __init__(self, viewer_id: str, annotation_color: QColor, parent=None):
@@ -894,8 +1177,21 @@ class PDFViewer(QWidget):
         self.current_page_index = 0
         
         # NEW: Lazy loading configuration
-        self.lazy_load_window = 10  # Pages to keep loaded before/after viewport
+        self.lazy_load_window = 4  # Pages to keep loaded before/after viewport
         self.last_loaded_range = (0, 0)  # Track what's currently loaded
+        self.page_geometry = None  # Cached (tops, bottoms, centers) of pages for scroll lookups
+        
+        # Rendered pages live in the global QPixmapCache (byte-bounded LRU), so a document open
+        # in both viewers shares its renders
+        self.doc_id = None
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        
+        # Background rendering; results from a previous document are ignored by generation
+        self.render_lock = DOCUMENT_LOCK
+        self.render_generation = 0
+        self.render_signals = PageRenderSignals()
+        self.render_signals.finished.connect(self.on_page_rendered)
 
         self.init_ui()
 
@@ -929,6 +1225,8 @@ class PDFViewer(QWidget):
 
         self.toolbar_layout.addStretch()
         self.layout.addLayout(self.toolbar_layout)
+        self.toolbar_widgets = (self.rect_btn, self.clear_ann_btn, self.rotate_left_btn,
+                                self.rotate_right_btn, self.toggle_rotate_btn)
         self.hide_toolbar()
 
         self.open_btn = QPushButton("Open PDF")
@@ -940,10 +1238,8 @@ class PDFViewer(QWidget):
 
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout()
-        self.scroll_content.setLayout(self.scroll_layout)
-        self.scroll_area.setWidget(self.scroll_content)
+        self.scroll_content = None
+        self.reset_scroll_content()
         self.layout.addWidget(self.scroll_area)
 
         self.page_counter_label = QLabel("Page — / —")
@@ -951,15 +1247,34 @@ class PDFViewer(QWidget):
         self.page_counter_label.setStyleSheet("color: #666; font-size: 11px; padding: 2px 4px;")
         self.layout.addWidget(self.page_counter_label)
 
-        self.scroll_area.verticalScrollBar().valueChanged.connect(self.update_current_page_from_scroll)
+        # Coalesce rapid scroll ticks into one page/lazy-load update per frame
+        self.scroll_timer = QTimer()
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(16)
+        self.scroll_timer.timeout.connect(self.update_current_page_from_scroll)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(lambda _value: self.scroll_timer.start())
+
+        # Window resizes arrive per pixel while dragging; only re-check visible pages once it settles
+        self.resize_timer = QTimer()
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(200)
+        self.resize_timer.timeout.connect(self.update_current_page_from_scroll)
 
         self.setLayout(self.layout)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # The layout may stretch pages to the new height, moving their offsets
+        self.page_geometry = None
+        self.resize_timer.start()
+
     def connect_page_signals(self, page_widget):
         """Connect annotation change signals from a page widget"""
         page_widget.annotation_modified.connect(self.annotations_changed.emit)
         page_widget.annotation_created.connect(self.annotation_created.emit)  # NEW
         page_widget.selection_changed.connect(self.selection_changed.emit)  # NEW: Connect selection changed signal
+        page_widget.annotation_mutated.connect(self.annotation_mutated.emit)
+        page_widget.annotation_layout_changed.connect(self.annotation_layout_changed.emit)
 
     def load_pdf_with_annotations(self, pdf_path, annotations_data):
         """Load PDF and apply saved annotations"""
@@ -992,47 +1307,37 @@ class PDFViewer(QWidget):
             self.toggle_rotate_btn.setText("Rotate Individually")
 
     def show_toolbar(self):
-        for i in range(self.toolbar_layout.count()):
-            widget = self.toolbar_layout.itemAt(i).widget()
-            if widget:
-                widget.show()
+        for widget in self.toolbar_widgets:
+            widget.show()
 
     def hide_toolbar(self):
-        for i in range(self.toolbar_layout.count()):
-            widget = self.toolbar_layout.itemAt(i).widget()
-            if widget:
-                widget.hide()
+        for widget in self.toolbar_widgets:
+            widget.hide()
     
     def hide_specific_buttons(self):
         """Hide specific buttons for link mode"""
-        self.rect_btn.hide()
-        self.clear_ann_btn.hide()
-        self.rotate_left_btn.hide()
-        self.rotate_right_btn.hide()
-        self.toggle_rotate_btn.hide()
+        self.hide_toolbar()
     
     def show_specific_buttons(self):
         """Show specific buttons for normal mode"""
-        self.rect_btn.show()
-        self.clear_ann_btn.show()
-        self.rotate_left_btn.show()
-        self.rotate_right_btn.show()
-        self.toggle_rotate_btn.show()
+        self.show_toolbar()
 
     def reset_viewer(self):
         """Reset viewer to initial empty state"""
         # Clear any loaded PDF
+        if self.pdf_document is not None:
+            release_shared_document(self.pdf_document)
         self.pdf_document = None
         self.pdf_path = None
+        self.doc_id = None
+        self.render_generation += 1
         self.global_rotation = 0
         self.current_page_index = 0
         
         # Clear all page widgets
         self.page_widgets.clear()
-        while self.scroll_layout.count():
-            item = self.scroll_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self.page_geometry = None
+        self.reset_scroll_content()
         
         # Clear linked highlighting
         self.clear_linked_highlighting()
@@ -1052,6 +1357,7 @@ class PDFViewer(QWidget):
             viewer_id = int(self.viewer_id)
             self.owner.current_annotation_index[viewer_id] = 0
             self.owner.all_annotations[viewer_id].clear()
+            self.owner._annotation_keys[viewer_id].clear()
             if hasattr(self.owner, 'update_navigation_labels'):
                 self.owner.update_navigation_labels()
 
@@ -1090,8 +1396,13 @@ class PDFViewer(QWidget):
 
     def load_pdf(self, file_path: str):
         try:
-            self.pdf_document = fitz.open(file_path)
+            document, doc_id = open_shared_document(file_path)
+            if self.pdf_document is not None:
+                release_shared_document(self.pdf_document)
+            self.pdf_document = document
+            self.doc_id = doc_id
             self.pdf_path = file_path
+            self.render_generation += 1
             self.global_rotation = 0
             self.current_page_index = 0
             self.open_btn.hide()
@@ -1101,24 +1412,45 @@ class PDFViewer(QWidget):
         except Exception as e:
             print(f"Error loading PDF: {e}")
 
+    def reset_scroll_content(self):
+        """Swap in an empty page container, dropping the old pages with a single deleteLater"""
+        old_content = self.scroll_area.takeWidget() if self.scroll_content is not None else None
+        self.scroll_content = QWidget()
+        self.scroll_layout = QVBoxLayout()
+        self.scroll_content.setLayout(self.scroll_layout)
+        self.scroll_area.setWidget(self.scroll_content)
+        if old_content is not None:
+            old_content.deleteLater()  # Page widgets are its children and go with it
+
     def display_pages(self):
         if not self.pdf_document:
             return
 
         self.page_widgets.clear()
-        while self.scroll_layout.count():
-            item = self.scroll_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        for page_num in range(len(self.pdf_document)):
-            page = self.pdf_document[page_num]
-            pdf_page = PDFPage(page, page_num, owner=self, annotation_color=self.annotation_color)
-            pdf_page.rotation = self.global_rotation if self.rotate_all else 0
-            pdf_page.render_placeholder()  # Start with placeholder
-            self.connect_page_signals(pdf_page)
-            self.scroll_layout.addWidget(pdf_page)
-            self.page_widgets.append(pdf_page)
+        self.page_geometry = None
+        self.reset_scroll_content()
+
+        # Add all pages with painting and layout suspended, so the scroll area is laid out once
+        self.scroll_content.setUpdatesEnabled(False)
+        self.scroll_layout.setEnabled(False)
+        try:
+            for page_num in range(len(self.pdf_document)):
+                with self.render_lock:
+                    page = self.pdf_document[page_num]
+                pdf_page = PDFPage(page, page_num, owner=self, annotation_color=self.annotation_color)
+                if self.rotate_all and self.global_rotation:
+                    pdf_page.rotate(self.global_rotation)
+                self.connect_page_signals(pdf_page)
+                self.scroll_layout.addWidget(pdf_page)
+                self.page_widgets.append(pdf_page)
+        finally:
+            self.scroll_layout.setEnabled(True)
+            self.scroll_content.setUpdatesEnabled(True)
+        self.scroll_layout.activate()
+
+        # Loading every page fills the store with page trees that renders don't need again
+        with self.render_lock:
+            trim_document_store(100)
 
         self.update_page_counter_label()
         
@@ -1141,21 +1473,12 @@ class PDFViewer(QWidget):
         viewport_top = scroll_area.verticalScrollBar().value()
         viewport_bottom = viewport_top + scroll_area.viewport().height()
         
-        # Find pages in viewport
-        first_visible = None
-        last_visible = None
-        
-        for i, page_widget in enumerate(self.page_widgets):
-            page_top = page_widget.y()
-            page_bottom = page_top + page_widget.height()
-            
-            # Check if page intersects viewport
-            if page_bottom >= viewport_top and page_top <= viewport_bottom:
-                if first_visible is None:
-                    first_visible = i
-                last_visible = i
+        # Find pages in viewport - pages are stacked, so both edges can be bisected
+        tops, bottoms, _ = self.get_page_geometry()
+        first_visible = bisect.bisect_left(bottoms, viewport_top)
+        last_visible = bisect.bisect_right(tops, viewport_bottom) - 1
         
-        if first_visible is None:
+        if first_visible > last_visible:
             first_visible = 0
             last_visible = 0
         
@@ -1165,22 +1488,46 @@ class PDFViewer(QWidget):
         
         # Unload pages outside the window (only if we had a previous range)
         if self.last_loaded_range != (0, 0):  # <-- ADD THIS CHECK
+            # Pages still queued for rendering are unloaded too, which cancels their job
             for i in range(self.last_loaded_range[0], load_start):
-                if i < len(self.page_widgets) and self.page_widgets[i].is_rendered:
-                    self.page_widgets[i].render_placeholder()
+                if i < len(self.page_widgets) and (self.page_widgets[i].is_rendered or self.page_widgets[i].render_job is not None):
+                    self.page_widgets[i].unrender()
             
             for i in range(load_end + 1, self.last_loaded_range[1] + 1):
-                if i < len(self.page_widgets) and self.page_widgets[i].is_rendered:
-                    self.page_widgets[i].render_placeholder()
+                if i < len(self.page_widgets) and (self.page_widgets[i].is_rendered or self.page_widgets[i].render_job is not None):
+                    self.page_widgets[i].unrender()
         
-        # Load pages in the window
+        # Load pages in the window - visible pages first, then neighbours by distance, so the
+        # pages the user is about to scroll onto are prefetched before the rest of the window
         for i in range(load_start, load_end + 1):
             if i < len(self.page_widgets) and not self.page_widgets[i].is_rendered:
-                self.page_widgets[i].render_full()
+                distance = max(first_visible - i, i - last_visible, 0)
+                self.page_widgets[i].render_full(priority=-distance)
         
         # Update tracking
         self.last_loaded_range = (load_start, load_end)
         
+    def on_page_rendered(self, generation, index, rotation, qimg):
+        """Cache a page rendered on a worker thread and hand it to its page widget"""
+        if generation != self.render_generation or index >= len(self.page_widgets):
+            return
+        qpixmap = QPixmap.fromImage(qimg, Qt.ImageConversionFlag.NoFormatConversion)
+        cache_key = (index, rotation, qimg.devicePixelRatio())
+        self.cache_pixmap(cache_key, qpixmap)
+        self.page_widgets[index].on_render_finished(cache_key, qpixmap)
+
+    def pixmap_cache_key(self, key):
+        """QPixmapCache key for (page_index, rotation, device_pixel_ratio) of the open document"""
+        return f"page:{self.doc_id}:{key[0]}:{key[1]}:{key[2]}"
+
+    def get_cached_pixmap(self, key):
+        """Return a cached page pixmap for (page_index, rotation, device_pixel_ratio), or None"""
+        return QPixmapCache.find(self.pixmap_cache_key(key))
+
+    def cache_pixmap(self, key, pixmap):
+        """Store a rendered page pixmap; QPixmapCache evicts the least recently used"""
+        QPixmapCache.insert(self.pixmap_cache_key(key), pixmap)
+
     def update_page_counter_label(self):
         total = len(self.page_widgets)
         if total == 0:
@@ -1196,6 +1543,19 @@ class PDFViewer(QWidget):
             self.current_page_index = index
             self.update_page_counter_label()
 
+    def get_page_geometry(self):
+        """Sorted page tops, bottoms and centers, recomputed only after page sizes changed"""
+        if self.page_geometry is None:
+            self.scroll_layout.activate()  # Apply pending size changes before reading positions
+            tops = [w.y() for w in self.page_widgets]
+            heights = [w.height() for w in self.page_widgets]
+            self.page_geometry = (
+                tops,
+                [top + h for top, h in zip(tops, heights)],
+                [top + h / 2 for top, h in zip(tops, heights)],
+            )
+        return self.page_geometry
+
     def update_current_page_from_scroll(self):
         if not self.page_widgets:
             return
@@ -1204,16 +1564,12 @@ class PDFViewer(QWidget):
         viewport_h = self.scroll_area.viewport().height()
         viewport_center_y = vy + viewport_h / 2
 
-        closest_idx = 0
-        closest_dist = float('inf')
-        for i, w in enumerate(self.page_widgets):
-            top = w.y()
-            h = w.height()
-            center = top + h / 2
-            dist = abs(center - viewport_center_y)
-            if dist < closest_dist:
-                closest_dist = dist
-                closest_idx = i
+        # Page centers are sorted, so the closest page is next to the bisection point
+        centers = self.get_page_geometry()[2]
+        closest_idx = bisect.bisect_left(centers, viewport_center_y)
+        if closest_idx == len(centers) or (
+                closest_idx > 0 and viewport_center_y - centers[closest_idx - 1] <= centers[closest_idx] - viewport_center_y):
+            closest_idx -= 1
         self.set_current_page(closest_idx)
         
         # NEW: Trigger lazy loading
@@ -1222,19 +1578,59 @@ class PDFViewer(QWidget):
     def rotate_pages(self, angle: int):
         if self.rotate_all:
             self.global_rotation = (self.global_rotation + angle) % 360
-            current_idx = self.current_page_index
-            self.display_pages()
-            self.set_current_page(current_idx)
+            # Re-render existing pages in place; previously seen rotations come from the cache
+            for page_widget in self.page_widgets:
+                page_widget.set_rotation(self.global_rotation)
+            self.load_visible_pages()
         else:
             if not self.page_widgets:
                 return
             self.page_widgets[self.current_page_index].rotate(angle)
 
+class PairItemDelegate(QStyledItemDelegate):
+    """Formats pair list rows on demand so only visible rows are processed"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.exists_cache = {}  # path -> bool, filled lazily as rows are painted
+    
+    def path_exists(self, path):
+        """Cached os.path.exists lookup"""
+        if path not in self.exists_cache:
+            self.exists_cache[path] = os.path.exists(path) if path else False
+        return self.exists_cache[path]
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        pair_data = index.data(Qt.ItemDataRole.UserRole)
+        if not pair_data:
+            return
+        
+        pair_id = index.data(Qt.ItemDataRole.UserRole + 1)
+        name = pair_data.get('name', f'Pair {pair_id}')
+        description = pair_data.get('description', '')
+        
+        # Create display text
+        lines = [name]
+        if description:
+            lines.append(description)
+        
+        # Add status indicators
+        pdf1_exists = self.path_exists(pair_data.get('pdf1_path', ''))
+        pdf2_exists = self.path_exists(pair_data.get('pdf2_path', ''))
+        if not pdf1_exists or not pdf2_exists:
+            lines.append("⚠️ Some PDF files are missing")
+            option.backgroundBrush = QBrush(QColor(255, 200, 200))  # Light red background
+        
+        option.text = "\n".join(lines)
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+
 class HomeScreen(QWidget):
     """Home screen showing saved PDF pairs"""
     
     pair_selected = pyqtSignal(dict)  # Signal emitted when a pair is selected
     new_pair_requested = pyqtSignal()  # Signal emitted when new pair button is clicked
+    pair_delete_requested = pyqtSignal(str)  # Signal emitted with the pair_id once a delete is confirmed
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1260,6 +1656,8 @@ class HomeScreen(QWidget):
         
         # Pairs list
         self.pairs_list = QListWidget()
+        self.pairs_delegate = PairItemDelegate(self.pairs_list)
+        self.pairs_list.setItemDelegate(self.pairs_delegate)
         self.pairs_list.itemDoubleClicked.connect(self.on_pair_selected)
         layout.addWidget(self.pairs_list)
         
@@ -1283,35 +1681,20 @@ class HomeScreen(QWidget):
     def load_pairs(self):
         """Load PDF pairs from JSON file"""
         self.pairs_list.clear()
+        self.pairs_delegate.exists_cache.clear()
         
         if not os.path.exists(self.data_file):
             return
             
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = json.loads(f.read())
                 
             for pair_id, pair_data in data.get('pairs', {}).items():
-                # Check if both PDFs still exist
-                pdf1_exists = os.path.exists(pair_data.get('pdf1_path', ''))
-                pdf2_exists = os.path.exists(pair_data.get('pdf2_path', ''))
-                
+                # Display text and missing-PDF check are computed by the delegate when painted
                 item = QListWidgetItem()
-                name = pair_data.get('name', f'Pair {pair_id}')
-                description = pair_data.get('description', '')
-                
-                # Create display text
-                display_text = name
-                if description:
-                    display_text += f"\n{description}"
-                
-                # Add status indicators
-                if not pdf1_exists or not pdf2_exists:
-                    display_text += "\n⚠️ Some PDF files are missing"
-                    item.setBackground(QColor(255, 200, 200))  # Light red background
-                
-                item.setText(display_text)
                 item.setData(Qt.ItemDataRole.UserRole, pair_data)
+                item.setData(Qt.ItemDataRole.UserRole + 1, pair_id)
                 self.pairs_list.addItem(item)
                 
         except Exception as e:
@@ -1346,33 +1729,8 @@ class HomeScreen(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Remove from JSON file
-            try:
-                if os.path.exists(self.data_file):
-                    with open(self.data_file, 'r') as f:
-                        data = json.load(f)
-                    
-                    # Find and remove the pair
-                    pairs = data.get('pairs', {})
-                    pair_id_to_remove = None
-                    for pair_id, stored_pair_data in pairs.items():
-                        if (stored_pair_data.get('name') == pair_data.get('name') and
-                            stored_pair_data.get('pdf1_path') == pair_data.get('pdf1_path') and
-                            stored_pair_data.get('pdf2_path') == pair_data.get('pdf2_path')):
-                            pair_id_to_remove = pair_id
-                            break
-                    
-                    if pair_id_to_remove:
-                        del pairs[pair_id_to_remove]
-                        data['pairs'] = pairs
-                        
-                        with open(self.data_file, 'w') as f:
-                            json.dump(data, f, indent=2)
-                        
-                        self.load_pairs()  # Refresh the list
-                        
-            except Exception as e:
-                QMessageBox.critical(self, 'Error', f'Failed to delete pair: {e}')
+            # The app owns the in-memory copy of the data file, so it does the removal
+            self.pair_delete_requested.emit(current_item.data(Qt.ItemDataRole.UserRole + 1))
 
 class LinkScreen(QWidget):
     """Link screen showing PDF viewer with red rectangles and hidden buttons"""
@@ -1382,6 +1740,13 @@ class LinkScreen(QWidget):
         self.parent_app = parent
         self.add_questions_mode = False  # Track if we're in add questions mode
         self.current_stem_id = None      # Track the current stem being added to
+        
+        # Coalesce bursts of annotation/selection signals into one UI refresh per frame
+        self._update_timer = QTimer()
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._apply_updates)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -1430,11 +1795,6 @@ class LinkScreen(QWidget):
         self.viewer2.annotations_changed.connect(self.on_annotations_changed)
         self.viewer2.selection_changed.connect(self.on_selection_changed)
         
-        # Connect annotation signals to parent app for auto-save functionality
-        if self.parent_app:
-            self.viewer1.annotations_changed.connect(self.parent_app.on_annotations_changed)
-            self.viewer2.annotations_changed.connect(self.parent_app.on_annotations_changed)
-        
         # Third pane = side panel (320px)
         self.third_pane = QWidget()
         self.third_pane.setFixedWidth(320)
@@ -1500,10 +1860,9 @@ class LinkScreen(QWidget):
         self.pending_scroll_positions = {}
         
         # Load PDFs if they exist in parent
-        if hasattr(self.parent_app, 'viewer1') and self.parent_app.viewer1.pdf_path:
+        if self.parent_app.viewer1 is not None and self.parent_app.viewer1.pdf_path:
             # Store scroll position before loading
-            if hasattr(self.parent_app.viewer1, 'scroll_area'):
-                self.pending_scroll_positions['viewer1'] = self.parent_app.viewer1.scroll_area.verticalScrollBar().value()
+            self.pending_scroll_positions['viewer1'] = self.parent_app.viewer1.scroll_area.verticalScrollBar().value()
             
             self.viewer1.load_pdf_with_annotations(
                 self.parent_app.viewer1.pdf_path,
@@ -1516,10 +1875,9 @@ class LinkScreen(QWidget):
             self.viewer1.show_toolbar()
             self.viewer1.hide_specific_buttons()
             
-        if hasattr(self.parent_app, 'viewer2') and self.parent_app.viewer2.pdf_path:
+        if self.parent_app.viewer2 is not None and self.parent_app.viewer2.pdf_path:
             # Store scroll position before loading
-            if hasattr(self.parent_app.viewer2, 'scroll_area'):
-                self.pending_scroll_positions['viewer2'] = self.parent_app.viewer2.scroll_area.verticalScrollBar().value()
+            self.pending_scroll_positions['viewer2'] = self.parent_app.viewer2.scroll_area.verticalScrollBar().value()
             
             self.viewer2.load_pdf_with_annotations(
                 self.parent_app.viewer2.pdf_path,
@@ -1547,48 +1905,60 @@ class LinkScreen(QWidget):
         # Sync toolbar state with parent app
         if self.parent_app:
             # Sync auto-save label
-            if hasattr(self.parent_app, 'autosave_label'):
-                self.autosave_label.setText(self.parent_app.autosave_label.text())
-                self.autosave_label.setStyleSheet(self.parent_app.autosave_label.styleSheet())
+            if self.parent_app.autosave_label is not None:
+                self._sync_label(self.autosave_label, self.parent_app.autosave_label)
             
             # Sync auto teleport button state
-            if hasattr(self.parent_app, 'teleport_mode_btn'):
+            if self.parent_app.teleport_mode_btn is not None:
                 self.teleport_mode_btn.setChecked(self.parent_app.teleport_mode_btn.isChecked())
                 if self.parent_app.teleport_mode_btn.isChecked():
                     self.teleport_mode_btn.setText("🔒 Auto Teleport")
                 else:
                     self.teleport_mode_btn.setText("🔓 Auto Teleport")
     
+    def _sync_label(self, dst, src):
+        """Copy text and style from src to dst, skipping unchanged values to avoid re-polish"""
+        text = src.text()
+        style = src.styleSheet()
+        if dst.text() != text:
+            dst.setText(text)
+        if dst.styleSheet() != style:
+            dst.setStyleSheet(style)
+    
     def on_annotations_changed(self):
         """Handle annotation changes in link mode"""
-        # Update the mark stem button state when annotations change
-        self.update_mark_stem_button_state()
-        
-        # Sync auto-save label with parent app
-        if self.parent_app and hasattr(self.parent_app, 'autosave_label'):
-            self.autosave_label.setText(self.parent_app.autosave_label.text())
-            self.autosave_label.setStyleSheet(self.parent_app.autosave_label.styleSheet())
+        # Forward to parent app for auto-save functionality
+        if self.parent_app:
+            self.parent_app._on_annotations_changed_combined()
+        self._update_timer.start()
     
     def on_selection_changed(self):
         """Handle selection changes in link mode"""
-        # Update the mark stem button state when selection changes
+        self._update_timer.start()
+    
+    def _apply_updates(self):
+        """Apply the coalesced UI refresh after annotation/selection changes"""
+        # Update the mark stem button state when annotations or selection change
         self.update_mark_stem_button_state()
+        
+        # Sync auto-save label with parent app
+        if self.parent_app and self.parent_app.autosave_label is not None:
+            self._sync_label(self.autosave_label, self.parent_app.autosave_label)
     
     def go_to_home(self):
         """Navigate to home screen"""
         if self.parent_app:
             # Show the specific buttons again before going home
-            if hasattr(self.parent_app, 'viewer1'):
+            if self.parent_app.viewer1 is not None:
                 self.parent_app.viewer1.show_specific_buttons()
-            if hasattr(self.parent_app, 'viewer2'):
+            if self.parent_app.viewer2 is not None:
                 self.parent_app.viewer2.show_specific_buttons()
             
             # Sync the parent app's toolbar state before going home
-            if hasattr(self.parent_app, 'autosave_label'):
-                self.parent_app.autosave_label.setText(self.autosave_label.text())
-                self.parent_app.autosave_label.setStyleSheet(self.autosave_label.styleSheet())
+            if self.parent_app.autosave_label is not None:
+                self._sync_label(self.parent_app.autosave_label, self.autosave_label)
             
-            if hasattr(self.parent_app, 'teleport_mode_btn'):
+            if self.parent_app.teleport_mode_btn is not None:
                 self.parent_app.teleport_mode_btn.setChecked(self.teleport_mode_btn.isChecked())
                 if self.parent_app.teleport_mode_btn.isChecked():
                     self.parent_app.teleport_mode_btn.setText("🔒 Auto Teleport")
@@ -1606,17 +1976,16 @@ class LinkScreen(QWidget):
             # Scroll positions will be synced after Selection Editor is shown
             
             # Show the specific buttons again before going back
-            if hasattr(self.parent_app, 'viewer1'):
+            if self.parent_app.viewer1 is not None:
                 self.parent_app.viewer1.show_specific_buttons()
-            if hasattr(self.parent_app, 'viewer2'):
+            if self.parent_app.viewer2 is not None:
                 self.parent_app.viewer2.show_specific_buttons()
             
             # Sync the parent app's toolbar state before going back
-            if hasattr(self.parent_app, 'autosave_label'):
-                self.parent_app.autosave_label.setText(self.autosave_label.text())
-                self.parent_app.autosave_label.setStyleSheet(self.autosave_label.styleSheet())
+            if self.parent_app.autosave_label is not None:
+                self._sync_label(self.parent_app.autosave_label, self.autosave_label)
             
-            if hasattr(self.parent_app, 'teleport_mode_btn'):
+            if self.parent_app.teleport_mode_btn is not None:
                 self.parent_app.teleport_mode_btn.setChecked(self.teleport_mode_btn.isChecked())
                 if self.parent_app.teleport_mode_btn.isChecked():
                     self.parent_app.teleport_mode_btn.setText("🔒 Auto Teleport")
@@ -1721,16 +2090,16 @@ class LinkScreen(QWidget):
         question_selection = None
         
         # First check LinkScreen viewers (current screen)
-        if hasattr(self, 'viewer1') and hasattr(self.viewer1, 'page_widgets'):
+        if self.viewer1 is not None:
             for page_widget in self.viewer1.page_widgets:
-                if hasattr(page_widget, 'selected_rect') and page_widget.selected_rect:
+                if page_widget.selected_rect is not None:
                     question_selection = page_widget.selected_rect
                     break
         
         # If no selection in LinkScreen, check parent app viewers
-        if not question_selection and hasattr(self.parent_app, 'viewer1') and hasattr(self.parent_app.viewer1, 'page_widgets'):
+        if not question_selection and self.parent_app.viewer1 is not None:
             for page_widget in self.parent_app.viewer1.page_widgets:
-                if hasattr(page_widget, 'selected_rect') and page_widget.selected_rect:
+                if page_widget.selected_rect is not None:
                     question_selection = page_widget.selected_rect
                     break
         
@@ -1738,16 +2107,16 @@ class LinkScreen(QWidget):
         answer_selection = None
         
         # First check LinkScreen viewers (current screen)
-        if hasattr(self, 'viewer2') and hasattr(self.viewer2, 'page_widgets'):
+        if self.viewer2 is not None:
             for page_widget in self.viewer2.page_widgets:
-                if hasattr(page_widget, 'selected_rect') and page_widget.selected_rect:
+                if page_widget.selected_rect is not None:
                     answer_selection = page_widget.selected_rect
                     break
         
         # If no selection in LinkScreen, check parent app viewers
-        if not answer_selection and hasattr(self.parent_app, 'viewer2') and hasattr(self.parent_app.viewer2, 'page_widgets'):
+        if not answer_selection and self.parent_app.viewer2 is not None:
             for page_widget in self.parent_app.viewer2.page_widgets:
-                if hasattr(page_widget, 'selected_rect') and page_widget.selected_rect:
+                if page_widget.selected_rect is not None:
                     answer_selection = page_widget.selected_rect
                     break
         
@@ -1756,7 +2125,7 @@ class LinkScreen(QWidget):
             # Check if the question is already marked as stem
             selection_id = getattr(question_selection, 'selection_id', None)
             is_already_stem = False
-            if selection_id and self.parent_app and hasattr(self.parent_app, 'links_data'):
+            if selection_id and self.parent_app:
                 if selection_id in self.parent_app.links_data.get("questions", {}):
                     question_data = self.parent_app.links_data["questions"][selection_id]
                     is_already_stem = question_data.get("isStem", False)
@@ -2297,7 +2666,31 @@ class LinkScreen(QWidget):
         # Clear the pending scroll positions
         self.pending_scroll_positions.clear()
     
+class AutosaveSignals(QObject):
+    """Signals for reporting background auto-save results back to the GUI thread"""
+    finished = pyqtSignal(bool, str)  # (success, error message)
+
+class AutosaveWorker(QRunnable):
+    """Writes an annotation snapshot to disk off the GUI thread"""
+    
+    def __init__(self, app, snapshot, signals):
+        super().__init__()
+        self.app = app
+        self.snapshot = snapshot
+        self.signals = signals
+    
+    def run(self):
+        try:
+            self.app.write_autosave_snapshot(self.snapshot)
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
 class DualPDFViewerApp(QMainWindow):
+    # Cached enum values for the application-wide event filter
+    _MOUSE_PRESS = QEvent.Type.MouseButtonPress
+    _MIDDLE_BUTTON = Qt.MouseButton.MiddleButton
+    
     def __init__(self):
         super().__init__()
         self.data_file = "pdf_pairs.json"
@@ -2316,13 +2709,40 @@ class DualPDFViewerApp(QMainWindow):
         self.autosave_timer.setSingleShot(True)
         self.autosave_timer.timeout.connect(self.perform_autosave)
         
+        # Background auto-save state - writes are serialized and stale snapshots skipped
+        self._save_lock = threading.Lock()
+        self._save_in_flight = False
+        self._save_again = False
+        self._autosave_seq = 0
+        self._last_written_seq = 0
+        self._pairs_cache = None  # In-memory copy of data_file, loaded from disk on first save
+        self._pairs_cache_mtime = None  # data_file's mtime when the cache was loaded or last written
+        self._pair_fragments = {}  # pair_id -> encoded JSON for pairs unchanged since the last write
+        self._autosave_signals = AutosaveSignals()
+        self._autosave_signals.finished.connect(self._on_autosave_finished)
+        
         # Auto Teleport Mode variables
         self.auto_teleport_mode = False
         self.current_active_viewer = None  # Which viewer is currently active (1 or 2)
         
         # Navigation tracking variables
         self.current_annotation_index = {1: 0, 2: 0}  # Current annotation index for each viewer
-        self.all_annotations = {1: [], 2: []}  # List of all annotations for each viewer
+        self.all_annotations = {1: [], 2: []}  # Sorted (page_index, y_position, annotation) tuples for each viewer
+        self._annotation_keys = {1: [], 2: []}  # Sort keys parallel to all_annotations, for bisect
+        self._lists_in_sync = False  # Set when an incremental update already refreshed the lists
+        self._lists_stale = False  # Set when a rebuild was skipped because no pair is loaded
+        
+        # Navigation rebuild timer - coalesces bursts of annotation changes into one rebuild
+        self._rebuild_timer = QTimer()
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(16)
+        self._rebuild_timer.timeout.connect(self._flush_rebuild)
+        
+        # Widgets created in init_ui - defaulted so callers can test against None
+        self.viewer1 = None
+        self.viewer2 = None
+        self.autosave_label = None
+        self.teleport_mode_btn = None
         
         self.init_ui()
         
@@ -2345,7 +2765,10 @@ class DualPDFViewerApp(QMainWindow):
         QTimer.singleShot(100, self.update_visual_states)
 
     def eventFilter(self, obj, event):
-        if self.auto_teleport_mode and event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.MiddleButton:
+        # Fast path: the filter is application-wide, so bail out on anything that isn't a press
+        if event.type() != self._MOUSE_PRESS:
+            return False
+        if self.auto_teleport_mode and event.button() == self._MIDDLE_BUTTON:
             self.switch_active_viewer()
             return True
         return super().eventFilter(obj, event)
@@ -2356,8 +2779,8 @@ class DualPDFViewerApp(QMainWindow):
             return False
             
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = json.loads(f.read())
             
             pairs = data.get('pairs', {})
             for pair_data in pairs.values():
@@ -2378,25 +2801,52 @@ class DualPDFViewerApp(QMainWindow):
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout()
         self.central_widget.setLayout(self.main_layout)
+        
+        # Screens live in a stack so switching just changes the visible page
+        self.stack = QStackedWidget()
+        self.main_layout.addWidget(self.stack)
 
-        # Home screen
-        self.home_screen = HomeScreen()
-        self.home_screen.pair_selected.connect(self.load_pair)
-        self.home_screen.new_pair_requested.connect(self.create_new_pair)
+        # Home screen and link screen are built on first use (see the properties below)
+        self._home_screen = None
+        self._link_screen = None
 
         # PDF viewer layout
         self.viewer_widget = QWidget()
         self.init_pdf_viewer()
-        
-        # Link screen
-        self.link_screen = LinkScreen(self)
+        self.stack.addWidget(self.viewer_widget)
 
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
 
+    @property
+    def home_screen(self):
+        """Home screen, created and added to the stack the first time it is needed"""
+        if self._home_screen is None:
+            self._home_screen = HomeScreen()
+            self._home_screen.pair_selected.connect(self.load_pair)
+            self._home_screen.new_pair_requested.connect(self.create_new_pair)
+            self._home_screen.pair_delete_requested.connect(self.delete_pair)
+            self.stack.addWidget(self._home_screen)
+        return self._home_screen
+
+    @property
+    def link_screen(self):
+        """Link screen, created and added to the stack the first time it is needed"""
+        if self._link_screen is None:
+            self._link_screen = LinkScreen(self)
+            self.stack.addWidget(self._link_screen)
+        return self._link_screen
+
+    def active_link_screen(self):
+        """The link screen if it is the screen being shown, else None (never creates it)"""
+        if self._link_screen is not None and self.stack.currentWidget() is self._link_screen:
+            return self._link_screen
+        return None
+
     def create_new_pair(self):
         """Create a completely new, empty PDF pair"""
+        self.invalidate_pairs_cache()  # The new pair's first save reloads data_file
         # Reset current pair info
         self.current_pair_id = None
         self.current_pair_name = ""
@@ -2434,6 +2884,7 @@ class DualPDFViewerApp(QMainWindow):
         # Reset navigation state
         self.current_annotation_index = {1: 0, 2: 0}
         self.all_annotations = {1: [], 2: []}
+        self._annotation_keys = {1: [], 2: []}
         self.update_navigation_labels()
         
         # Update visual states
@@ -2479,20 +2930,20 @@ class DualPDFViewerApp(QMainWindow):
         # Left viewer = blue (640px)
         self.viewer1 = PDFViewer("1", QColor(0, 0, 255, 150))
         self.viewer1.setFixedWidth(640)
-        self.viewer1.annotations_changed.connect(self.on_annotations_changed)
-        self.viewer1.annotation_created.connect(lambda: self.on_annotation_created(1))  # NEW
+        self.viewer1.annotations_changed.connect(self._on_annotations_changed_combined)
+        self.viewer1.annotation_created.connect(partial(self.on_annotation_created, 1))  # NEW
         self.viewer1.selection_changed.connect(self.on_selection_changed)  # NEW: Connect selection changed signal
+        self.viewer1.annotation_mutated.connect(partial(self._on_annotation_mutated, 1))
+        self.viewer1.annotation_layout_changed.connect(self._on_annotation_layout_changed)
         
         # Right viewer = orange (640px)  
         self.viewer2 = PDFViewer("2", QColor(255, 165, 0, 150))
         self.viewer2.setFixedWidth(640)
-        self.viewer2.annotations_changed.connect(self.on_annotations_changed)
-        self.viewer2.annotation_created.connect(lambda: self.on_annotation_created(2))  # NEW
+        self.viewer2.annotations_changed.connect(self._on_annotations_changed_combined)
+        self.viewer2.annotation_created.connect(partial(self.on_annotation_created, 2))  # NEW
         self.viewer2.selection_changed.connect(self.on_selection_changed)  # NEW: Connect selection changed signal
-        
-        # Connect annotation signals to update counter
-        self.viewer1.annotations_changed.connect(self.update_annotation_counter)
-        self.viewer2.annotations_changed.connect(self.update_annotation_counter)
+        self.viewer2.annotation_mutated.connect(partial(self._on_annotation_mutated, 2))
+        self.viewer2.annotation_layout_changed.connect(self._on_annotation_layout_changed)
         
         # Connect PDF loaded signals to update counter
         self.viewer1.pdf_loaded.connect(self.update_annotation_counter)
@@ -2559,7 +3010,17 @@ class DualPDFViewerApp(QMainWindow):
         counter_layout.addLayout(counter_display_layout)
         
         # Navigation controls - positioned right underneath the counters
+        # One shared style sheet for the arrow buttons, matched by their "role" property
+        navigation_widget = QWidget()
+        navigation_widget.setStyleSheet(
+            'QPushButton[role="navQuestion"] { background-color: #4a9eff; color: white; border: none; border-radius: 15px; font-size: 14px; } '
+            'QPushButton[role="navQuestion"]:hover { background-color: #3a8eef; } '
+            'QPushButton[role="navAnswer"] { background-color: #ffa500; color: white; border: none; border-radius: 15px; font-size: 14px; } '
+            'QPushButton[role="navAnswer"]:hover { background-color: #ff9500; } '
+            'QPushButton[role="navQuestion"]:disabled, QPushButton[role="navAnswer"]:disabled { background-color: #666; }'
+        )
         navigation_layout = QVBoxLayout()
+        navigation_layout.setContentsMargins(0, 0, 0, 0)
         navigation_layout.setSpacing(10)
         
         # Questions navigation
@@ -2568,8 +3029,8 @@ class DualPDFViewerApp(QMainWindow):
         
         self.questions_prev_btn = QPushButton("◀")
         self.questions_prev_btn.setFixedSize(30, 30)
-        self.questions_prev_btn.setStyleSheet("QPushButton { background-color: #4a9eff; color: white; border: none; border-radius: 15px; font-size: 14px; } QPushButton:hover { background-color: #3a8eef; } QPushButton:disabled { background-color: #666; }")
-        self.questions_prev_btn.clicked.connect(lambda: self.navigate_annotations(1, -1))
+        self.questions_prev_btn.setProperty("role", "navQuestion")
+        self.questions_prev_btn.clicked.connect(self._nav_q_prev)
         self.questions_prev_btn.setToolTip("Previous Question (Ctrl+Shift+Left)")
         questions_nav_layout.addWidget(self.questions_prev_btn)
         
@@ -2580,8 +3041,8 @@ class DualPDFViewerApp(QMainWindow):
         
         self.questions_next_btn = QPushButton("▶")
         self.questions_next_btn.setFixedSize(30, 30)
-        self.questions_next_btn.setStyleSheet("QPushButton { background-color: #4a9eff; color: white; border: none; border-radius: 15px; font-size: 14px; } QPushButton:hover { background-color: #3a8eef; } QPushButton:disabled { background-color: #666; }")
-        self.questions_next_btn.clicked.connect(lambda: self.navigate_annotations(1, 1))
+        self.questions_next_btn.setProperty("role", "navQuestion")
+        self.questions_next_btn.clicked.connect(self._nav_q_next)
         self.questions_next_btn.setToolTip("Next Question (Ctrl+Shift+Right)")
         questions_nav_layout.addWidget(self.questions_next_btn)
         
@@ -2599,8 +3060,8 @@ class DualPDFViewerApp(QMainWindow):
         
         self.answers_prev_btn = QPushButton("◀")
         self.answers_prev_btn.setFixedSize(30, 30)
-        self.answers_prev_btn.setStyleSheet("QPushButton { background-color: #ffa500; color: white; border: none; border-radius: 15px; font-size: 14px; } QPushButton:hover { background-color: #ff9500; } QPushButton:disabled { background-color: #666; }")
-        self.answers_prev_btn.clicked.connect(lambda: self.navigate_annotations(2, -1))
+        self.answers_prev_btn.setProperty("role", "navAnswer")
+        self.answers_prev_btn.clicked.connect(self._nav_a_prev)
         self.answers_prev_btn.setToolTip("Previous Answer (Ctrl+Alt+Left)")
         answers_nav_layout.addWidget(self.answers_prev_btn)
         
@@ -2611,14 +3072,22 @@ class DualPDFViewerApp(QMainWindow):
         
         self.answers_next_btn = QPushButton("▶")
         self.answers_next_btn.setFixedSize(30, 30)
-        self.answers_next_btn.setStyleSheet("QPushButton { background-color: #ffa500; color: white; border: none; border-radius: 15px; font-size: 14px; } QPushButton:hover { background-color: #ff9500; } QPushButton:disabled { background-color: #666; }")
-        self.answers_next_btn.clicked.connect(lambda: self.navigate_annotations(2, 1))
+        self.answers_next_btn.setProperty("role", "navAnswer")
+        self.answers_next_btn.clicked.connect(self._nav_a_next)
         self.answers_next_btn.setToolTip("Next Answer (Ctrl+Alt+Right)")
         answers_nav_layout.addWidget(self.answers_next_btn)
         
         navigation_layout.addLayout(answers_nav_layout)
         
-        counter_layout.addLayout(navigation_layout)
+        navigation_widget.setLayout(navigation_layout)
+        
+        # Lookup tables indexed by viewer id (1 = Questions, 2 = Answers)
+        self.viewers = (None, self.viewer1, self.viewer2)
+        self._nav_widgets = {
+            1: (self.questions_nav_label, self.questions_prev_btn, self.questions_next_btn),
+            2: (self.answers_nav_label, self.answers_prev_btn, self.answers_next_btn)
+        }
+        counter_layout.addWidget(navigation_widget)
         
         # Add some spacing
         counter_layout.addStretch()
@@ -2660,17 +3129,17 @@ class DualPDFViewerApp(QMainWindow):
         
         # Left PDF navigation (Questions)
         self.questions_prev_shortcut = QShortcut(QKeySequence("Ctrl+Shift+Left"), self)
-        self.questions_prev_shortcut.activated.connect(lambda: self.navigate_annotations(1, -1))
+        self.questions_prev_shortcut.activated.connect(self._nav_q_prev)
         
         self.questions_next_shortcut = QShortcut(QKeySequence("Ctrl+Shift+Right"), self)
-        self.questions_next_shortcut.activated.connect(lambda: self.navigate_annotations(1, 1))
+        self.questions_next_shortcut.activated.connect(self._nav_q_next)
         
         # Right PDF navigation (Answers)
         self.answers_prev_shortcut = QShortcut(QKeySequence("Ctrl+Alt+Left"), self)
-        self.answers_prev_shortcut.activated.connect(lambda: self.navigate_annotations(2, -1))
+        self.answers_prev_shortcut.activated.connect(self._nav_a_prev)
         
         self.answers_next_shortcut = QShortcut(QKeySequence("Ctrl+Alt+Right"), self)
-        self.answers_next_shortcut.activated.connect(lambda: self.navigate_annotations(2, 1))
+        self.answers_next_shortcut.activated.connect(self._nav_a_next)
 
     def toggle_auto_teleport_mode(self):
         """Toggle the auto teleport mode on/off"""
@@ -2711,8 +3180,6 @@ class DualPDFViewerApp(QMainWindow):
         self.current_active_viewer = None
         
         # Restore normal cursor for both viewers
-        self.viewer1.setCursor(Qt.CursorShape.ArrowCursor)
-        self.viewer2.setCursor(Qt.CursorShape.ArrowCursor)
         self.viewer1.unsetCursor()
         self.viewer2.unsetCursor()
         
@@ -2742,32 +3209,71 @@ class DualPDFViewerApp(QMainWindow):
             
         viewer_name = "PDF A (Left)" if self.current_active_viewer == 1 else "PDF B (Right)"
         message = f"🔒 AUTO TELEPORT: Active in {viewer_name} | Middle click to switch"
-        self.status_bar.showMessage(message)
+        self._show_status(message)
+
+    def _show_status(self, message):
+        """Show a persistent status bar message, skipping the update if it is already displayed"""
+        if self.status_bar.currentMessage() != message:
+            self.status_bar.showMessage(message)
 
     def update_annotation_counter(self):
         """Update the annotation counter display"""
-        # Count annotations in left PDF (Questions)
-        left_count = 0
-        if hasattr(self.viewer1, 'page_widgets'):
-            for page_widget in self.viewer1.page_widgets:
-                left_count += len(page_widget.annotations)
-        
-        # Count annotations in right PDF (Answers)
-        right_count = 0
-        if hasattr(self.viewer2, 'page_widgets'):
-            for page_widget in self.viewer2.page_widgets:
-                right_count += len(page_widget.annotations)
+        # Count annotations in left PDF (Questions) and right PDF (Answers)
+        for viewer, label in ((self.viewer1, self.questions_count), (self.viewer2, self.answers_count)):
+            label.setText(str(sum(len(page_widget.annotations) for page_widget in viewer.page_widgets)))
         
-        # Update the counter labels
-        self.questions_count.setText(str(left_count))
-        self.answers_count.setText(str(right_count))
+        # Navigation labels and annotation lists are rebuilt on the next idle tick
+        self._schedule_rebuild()
+
+    def _schedule_rebuild(self):
+        """Queue a full list rebuild unless an incremental update already handled the change"""
+        # No pair loaded yet - defer the rebuild until the user navigates or saves, but keep
+        # the labels and buttons current from a plain count of the pages' annotations
+        if not self.current_pair_id:
+            self._lists_stale = True
+            self.update_navigation_labels({
+                viewer_id: sum(len(page_widget.annotations) for page_widget in self.viewers[viewer_id].page_widgets)
+                for viewer_id in self._nav_widgets})
+            return
         
-        # Update navigation labels and rebuild annotation lists
-        self.update_navigation_labels()
+        if self._lists_in_sync:
+            # Consumed here, so a mutation never vouches for a later, unrelated change
+            self._lists_in_sync = False
+            self.update_navigation_labels()
+        else:
+            self._rebuild_timer.start()
+
+    def _on_annotation_layout_changed(self):
+        """Rotation moved annotations on screen - re-sort navigation without marking the pair modified"""
+        self._lists_in_sync = False
+        self._schedule_rebuild()
+
+    def _flush_rebuild(self):
+        """Rebuild annotation lists and navigation labels once per batch of changes"""
+        self._rebuild_timer.stop()
+        self._lists_stale = False
+        self._lists_in_sync = False
         self.rebuild_annotation_lists()
+        self.update_navigation_labels()
+
+    def _nav_q_prev(self):
+        self.navigate_annotations(1, -1)
+
+    def _nav_q_next(self):
+        self.navigate_annotations(1, 1)
+
+    def _nav_a_prev(self):
+        self.navigate_annotations(2, -1)
+
+    def _nav_a_next(self):
+        self.navigate_annotations(2, 1)
 
     def navigate_annotations(self, viewer_id, direction):
         """Navigate to next/previous annotation in the specified viewer"""
+        # Make sure a pending or deferred rebuild isn't leaving us with stale lists
+        if self._rebuild_timer.isActive() or self._lists_stale:
+            self._flush_rebuild()
+        
         if not self.all_annotations[viewer_id]:
             return
             
@@ -2775,11 +3281,9 @@ class DualPDFViewerApp(QMainWindow):
         current_idx = self.current_annotation_index[viewer_id]
         total_annotations = len(self.all_annotations[viewer_id])
         
-        if direction == 1:  # Next
-            new_idx = (current_idx + 1) % total_annotations
-        else:  # Previous
-            new_idx = (current_idx - 1) % total_annotations
-            
+        # direction is +1 (next) or -1 (previous); modulo wraps around both ends
+        new_idx = (current_idx + direction) % total_annotations
+        
         self.current_annotation_index[viewer_id] = new_idx
         
         # Navigate to the annotation
@@ -2793,14 +3297,13 @@ class DualPDFViewerApp(QMainWindow):
         if not self.all_annotations[viewer_id] or annotation_index >= len(self.all_annotations[viewer_id]):
             return
             
-        viewer = self.viewer1 if viewer_id == 1 else self.viewer2
-        annotation_info = self.all_annotations[viewer_id][annotation_index]
+        viewer = self.viewers[viewer_id]
+        target_page, _, target_annotation = self.all_annotations[viewer_id][annotation_index]
         
-        # Clear previous highlights
-        self.clear_all_highlights(viewer_id)
+        # Clear previous highlights - repaint is deferred until the new highlight is applied
+        dirty_pages = self.clear_all_highlights(viewer_id, repaint=False)
         
         # Go to the page with this annotation
-        target_page = annotation_info['page_index']
         if target_page < len(viewer.page_widgets):
             # Get the target page widget
             page_widget = viewer.page_widgets[target_page]
@@ -2811,12 +3314,13 @@ class DualPDFViewerApp(QMainWindow):
             scroll_area = viewer.scroll_area
             viewport_height = scroll_area.viewport().height()
             
-            # Get the page's position relative to the scroll content
-            page_pos = page_widget.mapTo(viewer.scroll_content, QPointF(0, 0))
+            # Get the page's position relative to the scroll content - pages are direct
+            # children of scroll_content, so y() is the offset without walking the parent chain
+            page_y = page_widget.y()
             page_height = page_widget.height()
             
             # Calculate scroll position to center the page
-            target_scroll_y = page_pos.y() - (viewport_height - page_height) / 2
+            target_scroll_y = page_y - (viewport_height - page_height) / 2
             
             # Ensure scroll position is within bounds
             max_scroll = viewer.scroll_content.height() - viewport_height
@@ -2826,7 +3330,7 @@ class DualPDFViewerApp(QMainWindow):
             scroll_area.verticalScrollBar().setValue(int(target_scroll_y))
             
             # Find and highlight the annotation by selection_id
-            target_selection_id = annotation_info['selection_id']
+            target_selection_id = getattr(target_annotation, 'selection_id', None)
             if target_selection_id:
                 for annotation in page_widget.annotations:
                     if hasattr(annotation, 'selection_id') and annotation.selection_id == target_selection_id:
@@ -2834,89 +3338,95 @@ class DualPDFViewerApp(QMainWindow):
                         page_widget.selected_rect = annotation
                         annotation.select()
                 
-                # Update the page widget
-                page_widget.viewport().update()
+                dirty_pages.add(page_widget)
+        
+        # Repaint each affected page once
+        for dirty_page in dirty_pages:
+            dirty_page.viewport().update()
 
-    def clear_all_highlights(self, viewer_id):
-        """Clear all highlights in the specified viewer"""
-        viewer = self.viewer1 if viewer_id == 1 else self.viewer2
-        if hasattr(viewer, 'page_widgets'):
-            for page_widget in viewer.page_widgets:
-                if hasattr(page_widget, 'selected_rect') and page_widget.selected_rect:
-                    page_widget.selected_rect.deselect()
-                    page_widget.selected_rect = None
-                for annotation in page_widget.annotations:
-                    annotation.deselect()
+    def clear_all_highlights(self, viewer_id, repaint=True):
+        """Clear all highlights in the specified viewer and return the pages that changed"""
+        viewer = self.viewers[viewer_id]
+        dirty_pages = set()
+        # Only the page's selected_rect can be highlighted, so skip the per-annotation sweep
+        for page_widget in viewer.page_widgets:
+            if page_widget.selected_rect is not None:
+                page_widget.selected_rect.deselect()
+                page_widget.selected_rect = None
+                dirty_pages.add(page_widget)
+        
+        if repaint:
+            for page_widget in dirty_pages:
                 page_widget.viewport().update()
+        return dirty_pages
 
     def rebuild_annotation_lists(self):
         """Rebuild the list of all annotations for navigation"""
-        # Clear existing lists
-        self.all_annotations[1].clear()
-        self.all_annotations[2].clear()
-        
-        # Rebuild for viewer 1 (Questions)
-        if hasattr(self.viewer1, 'page_widgets'):
-            for page_index, page_widget in enumerate(self.viewer1.page_widgets):
-                for annotation in page_widget.annotations:
-                    # Get the Y position of the annotation for sorting within the page
-                    rect = annotation.rect()
-                    pos = annotation.pos()
-                    y_pos = rect.y() + pos.y()
-                    
-                    self.all_annotations[1].append({
-                        'page_index': page_index,
-                        'annotation': annotation,
-                        'annotation': annotation,
-                        'y_position': y_pos,
-                        'selection_id': getattr(annotation, 'selection_id', None),
-                        'page': getattr(annotation, 'page_index', page_index) + 1  # Convert to 1-based page number
-                    })
-        
-        # Rebuild for viewer 2 (Answers)
-        if hasattr(self.viewer2, 'page_widgets'):
-            for page_index, page_widget in enumerate(self.viewer2.page_widgets):
-                for annotation in page_widget.annotations:
-                    # Get the Y position of the annotation for sorting within the page
-                    rect = annotation.rect()
-                    pos = annotation.pos()
-                    y_pos = rect.y() + pos.y()
-                    
-                    self.all_annotations[2].append({
-                        'page_index': page_index,
-                        'annotation': annotation,
-                        'annotation': annotation,
-                        'y_position': y_pos,
-                        'selection_id': getattr(annotation, 'selection_id', None),
-                        'page': getattr(annotation, 'page_index', page_index) + 1  # Convert to 1-based page number
-                    })
-        
-        # Sort annotations by page number first, then by Y position (top to bottom)
-        for viewer_id in [1, 2]:
-            self.all_annotations[viewer_id].sort(key=lambda x: (x['page_index'], x['y_position']))
-        
-        # Reset current indices if they're out of bounds
-        for viewer_id in [1, 2]:
-            if self.current_annotation_index[viewer_id] >= len(self.all_annotations[viewer_id]):
+        sort_key = itemgetter(0, 1)
+        for viewer_id, viewer in ((1, self.viewer1), (2, self.viewer2)):
+            entries = []
+            for page_index, page_widget in enumerate(viewer.page_widgets):
+                entries.extend([(page_index, annotation.top_y(), annotation) for annotation in page_widget.annotations])
+            
+            # Sort annotations by page number first, then by Y position (top to bottom)
+            entries.sort(key=sort_key)
+            keys = []
+            for page_index, y_pos, annotation in entries:
+                key = (page_index, y_pos)
+                annotation._nav_key = key
+                keys.append(key)
+            
+            self.all_annotations[viewer_id] = entries
+            self._annotation_keys[viewer_id] = keys
+            
+            # Reset current index if it's out of bounds
+            if self.current_annotation_index[viewer_id] >= len(entries):
                 self.current_annotation_index[viewer_id] = 0
 
-    def update_navigation_labels(self):
-        """Update the navigation labels with current counts"""
-        # Update Questions navigation
-        left_count = len(self.all_annotations[1])
-        current_left = self.current_annotation_index[1] + 1 if left_count > 0 else 0
-        self.questions_nav_label.setText(f"{current_left}/{left_count}")
+    def _on_annotation_mutated(self, viewer_id, annotation, kind):
+        """Apply a single add/remove/move to the sorted navigation list with bisect"""
+        entries = self.all_annotations[viewer_id]
+        keys = self._annotation_keys[viewer_id]
+        
+        # Drop the existing entry, located by its previous sort key
+        found = False
+        old_key = getattr(annotation, '_nav_key', None)
+        if old_key is not None:
+            i = bisect.bisect_left(keys, old_key)
+            while i < len(keys) and keys[i] == old_key:
+                if entries[i][2] is annotation:
+                    del entries[i]
+                    del keys[i]
+                    found = True
+                    break
+                i += 1
+            annotation._nav_key = None
+        
+        # Unknown annotation (e.g. recreated by a re-render) - leave it to the full rebuild
+        if kind != 'added' and not found:
+            return
         
-        # Update Answers navigation
-        right_count = len(self.all_annotations[2])
-        current_right = self.current_annotation_index[2] + 1 if right_count > 0 else 0
-        self.answers_nav_label.setText(f"{current_right}/{right_count}")
+        if kind != 'removed':
+            key = (annotation.page_widget.index, annotation.top_y())
+            i = bisect.bisect_right(keys, key)
+            keys.insert(i, key)
+            entries.insert(i, key + (annotation,))
+            annotation._nav_key = key
         
-        # Update button states
-        self.questions_prev_btn.setEnabled(left_count > 0)
-        self.questions_next_btn.setEnabled(left_count > 0)
-        self.answers_prev_btn.setEnabled(right_count > 0)
-        self.answers_next_btn.setEnabled(right_count > 0)
+        if self.current_annotation_index[viewer_id] >= len(entries):
+            self.current_annotation_index[viewer_id] = 0
+        self._lists_in_sync = True
+
+    def update_navigation_labels(self, counts=None):
+        """Update the navigation labels with current counts (taken from the navigation lists unless given)"""
+        for viewer_id, (nav_label, prev_btn, next_btn) in self._nav_widgets.items():
+            count = len(self.all_annotations[viewer_id]) if counts is None else counts[viewer_id]
+            current = min(self.current_annotation_index[viewer_id] + 1, count)
+            nav_label.setText(f"{current}/{count}")
+            
+            # Update button states
+            prev_btn.setEnabled(count > 0)
+            next_btn.setEnabled(count > 0)
 
     def on_annotation_created(self, viewer_id):
         pass  # Removed
@@ -2931,7 +3441,7 @@ class DualPDFViewerApp(QMainWindow):
             return
         
         # Get mouse position relative to old viewer
-        old_viewer = self.viewer1 if self.current_active_viewer == 1 else self.viewer2
+        old_viewer = self.viewers[self.current_active_viewer]
         mouse_global = QCursor.pos()
         mouse_local = old_viewer.mapFromGlobal(mouse_global)
             
@@ -2945,10 +3455,15 @@ class DualPDFViewerApp(QMainWindow):
         self.update_teleport_status()
         
         # Teleport mouse to same relative position in new viewer
-        new_viewer = self.viewer1 if self.current_active_viewer == 1 else self.viewer2
+        new_viewer = self.viewers[self.current_active_viewer]
         new_global = new_viewer.mapToGlobal(mouse_local)
         QCursor.setPos(new_global)
 
+    def _on_annotations_changed_combined(self):
+        """Single slot for viewer annotations_changed - auto-save plus counter refresh"""
+        self.on_annotations_changed()
+        self.update_annotation_counter()  # Also schedules the navigation rebuild
+
     def on_annotations_changed(self):
         """Called when annotations are modified - triggers auto-save"""
         if not self.is_closing and self.current_pair_id:
@@ -2963,73 +3478,193 @@ class DualPDFViewerApp(QMainWindow):
             self.autosave_timer.stop()
             self.autosave_timer.start(1000)  # Wait 1 second after last change
         
-        # Rebuild annotation lists for navigation
-        self.rebuild_annotation_lists()
-        self.update_navigation_labels()
-        
         # Update visual states based on links
         self.update_visual_states()
         
 
 
-    def perform_autosave(self):
-        """Perform the actual auto-save operation"""
+    def perform_autosave(self, blocking=False):
+        """Perform the actual auto-save operation (in the background unless blocking)"""
         if not self.has_unsaved_changes or not self.current_pair_id:
             return
             
         if not self.viewer1.pdf_path or not self.viewer2.pdf_path:
             return
         
-        try:
-            # Load existing data or create new
-            data = {'pairs': {}}
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
+        # A background save is running - save again once it finishes
+        if self._save_in_flight and not blocking:
+            self._save_again = True
+            return
+        
+        # Collect annotations from both viewers on the GUI thread
+        self._autosave_seq += 1
+        snapshot = {
+            'seq': self._autosave_seq,
+            'pair_id': self.current_pair_id,
+            'name': self.current_pair_name,
+            'description': self.current_pair_description,
+            'pdf1_path': self.viewer1.pdf_path,
+            'pdf2_path': self.viewer2.pdf_path,
+            'pdf1_annotations': self.viewer1.get_all_annotations_data(),
+            'pdf2_annotations': self.viewer2.get_all_annotations_data()
+        }
+        self.has_unsaved_changes = False
+        
+        if blocking:
+            try:
+                self.write_autosave_snapshot(snapshot)
+                self.show_autosave_result(True, "")
+            except Exception as e:
+                self.has_unsaved_changes = True
+                self.show_autosave_result(False, str(e))
+            return
+        
+        self._save_in_flight = True
+        QThreadPool.globalInstance().start(AutosaveWorker(self, snapshot, self._autosave_signals))
+
+    def write_autosave_snapshot(self, snapshot):
+        """Merge a snapshot into the data file and replace it atomically (safe to call from a worker thread)"""
+        with self._save_lock:
+            # A newer snapshot has already been written
+            if snapshot['seq'] <= self._last_written_seq:
+                return
             
-            # Collect annotations from both viewers
-            pdf1_annotations = self.viewer1.get_all_annotations_data()
-            pdf2_annotations = self.viewer2.get_all_annotations_data()
+            data = self._get_pairs_cache()
+            pair_id = snapshot['pair_id']
+            now = time.strftime('%Y-%m-%d %H:%M:%S')
             
             # Update existing pair data or create new
-            if self.current_pair_id in data['pairs']:
-                pair_data = data['pairs'][self.current_pair_id]
-                pair_data['pdf1_annotations'] = pdf1_annotations
-                pair_data['pdf2_annotations'] = pdf2_annotations
-                pair_data['updated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+            if pair_id in data['pairs']:
+                pair_data = data['pairs'][pair_id]
+                pair_data['pdf1_annotations'] = snapshot['pdf1_annotations']
+                pair_data['pdf2_annotations'] = snapshot['pdf2_annotations']
+                pair_data['updated_at'] = now
             else:
                 # This shouldn't happen normally, but handle it just in case
                 pair_data = {
-                    'pair_id': self.current_pair_id,
-                    'name': self.current_pair_name or f"Auto-saved Pair {self.current_pair_id}",
-                    'description': self.current_pair_description,
-                    'pdf1_path': self.viewer1.pdf_path,
-                    'pdf2_path': self.viewer2.pdf_path,
-                    'pdf1_annotations': pdf1_annotations,
-                    'pdf2_annotations': pdf2_annotations,
-                    'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')
+                    'pair_id': pair_id,
+                    'name': snapshot['name'] or f"Auto-saved Pair {pair_id}",
+                    'description': snapshot['description'],
+                    'pdf1_path': snapshot['pdf1_path'],
+                    'pdf2_path': snapshot['pdf2_path'],
+                    'pdf1_annotations': snapshot['pdf1_annotations'],
+                    'pdf2_annotations': snapshot['pdf2_annotations'],
+                    'created_at': now,
+                    'updated_at': now
                 }
-                data['pairs'][self.current_pair_id] = pair_data
-            
-            # Write to file
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            self.has_unsaved_changes = False
-            # Only update autosave label if not in auto teleport mode
-            if not self.auto_teleport_mode:
-                self.autosave_label.setText("Auto-save: ✓ Saved")
-                self.autosave_label.setStyleSheet("color: #4caf50; font-size: 11px; padding: 2px 4px;")
-                
-                # Reset to "Ready" after 3 seconds
-                QTimer.singleShot(3000, self.reset_autosave_label)
+                data['pairs'][pair_id] = pair_data
             
+            self._write_pairs_cache(pair_id)
+            self._last_written_seq = snapshot['seq']
+
+    def _data_file_mtime(self):
+        """mtime of data_file, or None if it doesn't exist"""
+        try:
+            return os.stat(self.data_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _get_pairs_cache(self):
+        """Return the in-memory pairs data, (re)loading it from disk when the file changed (call with _save_lock held)"""
+        mtime = self._data_file_mtime()
+        if self._pairs_cache is None or mtime != self._pairs_cache_mtime:
+            data = {'pairs': {}}
+            if mtime is not None:
+                with open(self.data_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+            self._pairs_cache = data
+            self._pairs_cache_mtime = mtime
+            self._pair_fragments = {}  # Encoded from the old data
+        return self._pairs_cache
+
+    def invalidate_pairs_cache(self):
+        """Drop the in-memory pairs data and its encoded fragments so the next save reloads data_file"""
+        with self._save_lock:
+            self._pairs_cache = None
+            self._pair_fragments = {}
+
+    def _encode_json(self, value):
+        """Encode a value as indented, ASCII-only JSON text like json.dump writes by default"""
+        if orjson:
+            text = orjson.dumps(value, option=orjson.OPT_INDENT_2).decode('utf-8')
+            # orjson writes raw UTF-8, but the other tools read the file with the locale encoding.
+            # Non-ASCII can only appear inside strings, so escaping it character by character is safe.
+            if not text.isascii():
+                text = ''.join(c if c.isascii() else json.dumps(c)[1:-1] for c in text)
+            return text
+        return json.dumps(value, indent=2)
+
+    def _write_pairs_cache(self, changed_pair_id=None):
+        """Persist the in-memory pairs data, re-encoding only the changed pair (call with _save_lock held)"""
+        if changed_pair_id is not None:
+            self._pair_fragments.pop(changed_pair_id, None)
+        
+        # Reuse the encoded JSON of every other pair. Keys keep their loaded order, so with the
+        # stdlib encoder this is exactly json.dump(indent=2); orjson may spell some floats differently.
+        sections = []
+        for key, value in self._pairs_cache.items():
+            if key != 'pairs' or not isinstance(value, dict) or not value:
+                sections.append(f'  {json.dumps(key)}: ' + self._encode_json(value).replace('\n', '\n  '))
+                continue
+            entries = []
+            for pair_id, pair_data in value.items():
+                fragment = self._pair_fragments.get(pair_id)
+                if fragment is None:
+                    fragment = self._encode_json(pair_data).replace('\n', '\n    ')
+                    self._pair_fragments[pair_id] = fragment
+                entries.append(f'    {json.dumps(pair_id)}: {fragment}')
+            sections.append('  "pairs": {\n' + ',\n'.join(entries) + '\n  }')
+        raw = ('{\n' + ',\n'.join(sections) + '\n}' if sections else '{}').encode('utf-8')
+        
+        # Write to a temp file then swap it in, so a crash never leaves a half-written file
+        tmp_path = self.data_file + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, self.data_file)
+        self._pairs_cache_mtime = self._data_file_mtime()
+
+    def delete_pair(self, pair_id):
+        """Remove a saved pair from the data file (requested by the home screen)"""
+        try:
+            with self._save_lock:
+                data = self._get_pairs_cache()
+                if data.get('pairs', {}).pop(pair_id, None) is not None:
+                    self._write_pairs_cache(pair_id)
         except Exception as e:
-            print(f"Auto-save error: {e}")
-            if not self.auto_teleport_mode:
-                self.autosave_label.setText("Auto-save: Error")
-                self.autosave_label.setStyleSheet("color: #f44336; font-size: 11px; padding: 2px 4px;")
+            QMessageBox.critical(self, 'Error', f'Failed to delete pair: {e}')
+        self.home_screen.load_pairs()  # Refresh the list
+
+    def _on_autosave_finished(self, success, error):
+        """Handle completion of a background auto-save"""
+        self._save_in_flight = False
+        if not success:
+            self.has_unsaved_changes = True
+        self.show_autosave_result(success, error)
+        
+        # Changes arrived while the save was running
+        if self._save_again:
+            self._save_again = False
+            self.perform_autosave()
+
+    def show_autosave_result(self, success, error):
+        """Update the auto-save label after a save attempt"""
+        if not success:
+            print(f"Auto-save error: {error}")
+        
+        # Only update autosave label if not in auto teleport mode
+        if self.auto_teleport_mode:
+            return
+        
+        if success:
+            self.autosave_label.setText("Auto-save: ✓ Saved")
+            self.autosave_label.setStyleSheet("color: #4caf50; font-size: 11px; padding: 2px 4px;")
+            
+            # Reset to "Ready" after 3 seconds
+            QTimer.singleShot(3000, self.reset_autosave_label)
+        else:
+            self.autosave_label.setText("Auto-save: Error")
+            self.autosave_label.setStyleSheet("color: #f44336; font-size: 11px; padding: 2px 4px;")
 
     def reset_autosave_label(self):
         """Reset auto-save label to ready state"""
@@ -3048,11 +3683,16 @@ class DualPDFViewerApp(QMainWindow):
         # Show the home screen
         self.show_home_screen()
     
+    def _swap_main_widget(self, widget):
+        """Make the given screen the visible page of the main stack"""
+        if self.stack.currentWidget() is not widget:
+            self.stack.setCurrentWidget(widget)
+
     def show_home_screen(self):
         """Show the home screen"""
         # Auto-save before leaving if needed
         if self.has_unsaved_changes and self.current_pair_id:
-            self.perform_autosave()
+            self.perform_autosave(blocking=True)
         
         # Disable auto teleport mode
         self.disable_auto_teleport_mode()
@@ -3066,16 +3706,13 @@ class DualPDFViewerApp(QMainWindow):
         # Clear all pending links (yellow highlighting)
         self.clear_all_pending_links()
         
-        # Clear the main layout
-        while self.main_layout.count():
-            item = self.main_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        # Nothing of the current pair is pending any more; start the next save from the file
+        self.invalidate_pairs_cache()
         
-        # Add home screen
-        self.main_layout.addWidget(self.home_screen)
+        # Show home screen
+        self._swap_main_widget(self.home_screen)
         self.home_screen.load_pairs()  # Refresh pairs list
-        self.status_bar.showMessage("Home - Select a PDF pair or create a pair")
+        self._show_status("Home - Select a PDF pair or create a pair")
 
     def show_pdf_viewer(self):
         """Show the PDF viewer"""
@@ -3085,16 +3722,10 @@ class DualPDFViewerApp(QMainWindow):
         if hasattr(self, 'viewer2'):
             self.viewer2.clear_linked_highlighting()
         
-        # Clear the main layout
-        while self.main_layout.count():
-            item = self.main_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        # Show PDF viewer
+        self._swap_main_widget(self.viewer_widget)
         
-        # Add PDF viewer
-        self.main_layout.addWidget(self.viewer_widget)
-        
-        self.status_bar.showMessage("PDF Viewer - Open PDFs to start annotating")
+        self._show_status("PDF Viewer - Open PDFs to start annotating")
 
     def show_link_screen(self):
         """Show the link screen"""
@@ -3104,14 +3735,8 @@ class DualPDFViewerApp(QMainWindow):
         if hasattr(self, 'viewer2'):
             self.viewer2.clear_linked_highlighting()
         
-        # Clear the main layout
-        while self.main_layout.count():
-            item = self.main_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
-        
-        # Add link screen
-        self.main_layout.addWidget(self.link_screen)
+        # Show link screen
+        self._swap_main_widget(self.link_screen)
         
         # Load PDFs and annotations from parent viewers
         self.link_screen.load_pdfs_from_parent()
@@ -3119,10 +3744,13 @@ class DualPDFViewerApp(QMainWindow):
         # Disable auto teleport mode when entering link mode
         self.disable_auto_teleport_mode()
         
-        self.status_bar.showMessage("Link Mode - All rectangles are unlinked (red)")
+        self._show_status("Link Mode - All rectangles are unlinked (red)")
 
     def load_pair(self, pair_data):
         """Load a PDF pair with its annotations"""
+        # The home screen may have edited the data file - reload it on the next save
+        self.invalidate_pairs_cache()
+        
         try:
             pdf1_path = pair_data.get('pdf1_path', '')
             pdf2_path = pair_data.get('pdf2_path', '')
@@ -3191,7 +3819,7 @@ class DualPDFViewerApp(QMainWindow):
         
         # If we have a current pair, just update it
         if self.current_pair_id:
-            self.perform_autosave()
+            self.perform_autosave(blocking=True)
             QMessageBox.information(self, 'Save Successful', f'PDF pair "{self.current_pair_name}" has been updated.')
             return
         
@@ -3206,11 +3834,7 @@ class DualPDFViewerApp(QMainWindow):
             return
         
         try:
-            # Load existing data or create new
-            data = {'pairs': {}}
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
+            now = time.strftime('%Y-%m-%d %H:%M:%S')
             
             # Generate unique pair ID
             if not self.current_pair_id:
@@ -3233,18 +3857,20 @@ class DualPDFViewerApp(QMainWindow):
                 'pdf2_path': self.viewer2.pdf_path,
                 'pdf1_annotations': pdf1_annotations,
                 'pdf2_annotations': pdf2_annotations,
-                'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')
+                'created_at': now,
+                'updated_at': now
             }
             
-            data['pairs'][self.current_pair_id] = pair_data
-            
-            # Write to file
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._save_lock:
+                self._get_pairs_cache()['pairs'][self.current_pair_id] = pair_data
+                self._write_pairs_cache(self.current_pair_id)
             
             self.has_unsaved_changes = False
             self.status_bar.showMessage(f"Saved pair: {self.current_pair_name}")
+            
+            # Navigation lists were not maintained before the pair existed
+            if self._lists_stale:
+                self._flush_rebuild()
             QMessageBox.information(self, 'Save Successful', f'PDF pair "{self.current_pair_name}" has been saved successfully.')
             
         except Exception as e:
@@ -3810,7 +4436,7 @@ class DualPDFViewerApp(QMainWindow):
         
         selection_id = selected_annotation.selection_id
         target_viewer_id = 2 if current_viewer_id == 1 else 1
-        target_viewer = self.viewer1 if target_viewer_id == 1 else self.viewer2
+        target_viewer = self.viewers[target_viewer_id]
         
         # Find the linked selection
         linked_selection_id = None
@@ -3841,9 +4467,9 @@ class DualPDFViewerApp(QMainWindow):
                     # Scroll to center this page in the viewport similar to go_to_annotation
                     scroll_area = target_viewer.scroll_area
                     viewport_height = scroll_area.viewport().height()
-                    page_pos = page_widget.mapTo(target_viewer.scroll_content, QPointF(0, 0))
+                    page_y = page_widget.y()  # Offset within scroll_content
                     page_height = page_widget.height()
-                    target_scroll_y = page_pos.y() - (viewport_height - page_height) / 2
+                    target_scroll_y = page_y - (viewport_height - page_height) / 2
                     max_scroll = target_viewer.scroll_content.height() - viewport_height
                     target_scroll_y = max(0, min(target_scroll_y, max_scroll))
                     scroll_area.verticalScrollBar().setValue(int(target_scroll_y))
@@ -3884,10 +4510,22 @@ class DualPDFViewerApp(QMainWindow):
         # Perform final auto-save if needed
         if self.has_unsaved_changes and self.current_pair_id:
             try:
-                self.perform_autosave()
+                self.perform_autosave(blocking=True)
             except Exception as e:
                 print(f"Error during final auto-save: {e}")
         
+        # Let any background auto-save finish writing before we exit; queued page renders are dropped
+        render_pool().clear()
+        render_pool().waitForDone()
+        QThreadPool.globalInstance().waitForDone()
+        
+        # Close the documents now rather than leaving them to interpreter teardown
+        for viewer in (getattr(self, 'viewer1', None), getattr(self, 'viewer2', None)):
+            if viewer is not None and viewer.pdf_document is not None:
+                release_shared_document(viewer.pdf_document)
+                viewer.pdf_document = None
+        release_render_buffers()
+        
         event.accept()
 
 def main():